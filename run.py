@@ -5,7 +5,14 @@ from src.app import create_app, config
 # Load environment variables
 load_dotenv()
 
-app = create_app()
+# The debug reloader runs the app in a child process (with WERKZEUG_RUN_MAIN set),
+# so the watching parent process doesn't start the scheduler too
+is_reloader_parent = (
+    __name__ == "__main__"
+    and config.DEBUG
+    and os.environ.get("WERKZEUG_RUN_MAIN") != "true"
+)
+app = create_app(start_scheduler=not is_reloader_parent)
 
 if __name__ == "__main__":
     app.run(host=config.HOST, port=config.PORT, debug=config.DEBUG)
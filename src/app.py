@@ -1,15 +1,30 @@
 import os
+from datetime import timedelta
+from functools import partial
 from dotenv import load_dotenv
 
 from flask import Flask
 
 from .config.config import Config
 
+from .models import NewsItemSchema
 from .services.database_service import SupabaseDBService
+from .services.content_store_service import ContentStoreService
+from .services.crawl_state_service import CrawlStateService
 from .services.auth_service import SupabaseAuthService
 from .services.openai_service import OpenAIService
+from .services.llm_cache_service import LLMCacheService
+from .services.llm_rate_limiter import LLMRateLimiter
+from .services.category_classifier_service import CategoryClassifierService
 from .services.scrapers.crawl4ai_scraper import Crawl4AIScraper
+from .services.scrapers.scrape_scheduler import ScrapeScheduler
+from .services.gnews_decoder_service import GoogleNewsDecoderService
+from .services.crawlers.http_session import HTTPSessionManager
 from .services.news_item_service import NewsItemService
+from .services.ingestion_pipeline import IngestionPipeline
+from .services.job_service import JobService
+from .services.periodic_scheduler import PeriodicScheduler
+from .utils import NearDuplicateIndex
 
 load_dotenv()  # Load environment variables from .env file
 
@@ -19,6 +34,9 @@ database_service: SupabaseDBService = None
 # Supabase auth service instance
 auth_service: SupabaseAuthService = None
 
+# Content store for scraped article bodies
+content_store_service: ContentStoreService = None
+
 # OpenAI service
 openai_service: OpenAIService = None
 
@@ -28,11 +46,25 @@ scraper: Crawl4AIScraper = None
 # NewsItem service instance
 news_item_service: NewsItemService = None
 
+# Ingestion pipeline instance
+ingestion_pipeline: IngestionPipeline = None
+
+# Background job service instance
+job_service: JobService = None
+
+# Periodic scheduler instance
+periodic_scheduler: PeriodicScheduler = None
+
 # calling dev config
 config = Config().dev_config
 
 
-def create_app():
+def create_app(start_scheduler: bool = False):
+    """
+    Create the app and its services. The periodic scheduler is only started, with
+    SCHEDULER_ENABLED, when the caller serves the app and opts in (see run.py), so
+    one-off scripts never run scheduled jobs alongside their own.
+    """
     app = Flask(__name__)
     app.env = config.ENV
     # app.secret_key = os.environ.get("SECRET_KEY")
@@ -43,6 +75,11 @@ def create_app():
         os.environ.get("SUPABASE_URL"), os.environ.get("SUPABASE_KEY")
     )
 
+    # Initialize content store, and let news items load their scraped content lazily
+    global content_store_service
+    content_store_service = ContentStoreService(database_service)
+    NewsItemSchema.set_content_loader(content_store_service.get)
+
     # Initialize Supabase auth service
     global auth_service
     auth_service = SupabaseAuthService(
@@ -51,15 +88,132 @@ def create_app():
 
     # Initialize Crawl4AI scraper
     global scraper
-    scraper = Crawl4AIScraper()
+    scraper = Crawl4AIScraper(max_concurrent_pages=config.SCRAPE_MAX_CONCURRENCY)
 
     # Initialize OpenAI service
     global openai_service
-    openai_service = OpenAIService()
+    openai_service = OpenAIService(
+        cache=LLMCacheService(
+            cache_path=config.LLM_CACHE_PATH,
+            max_size_bytes=config.LLM_CACHE_MAX_SIZE_BYTES,
+        ),
+        rate_limiter=LLMRateLimiter(
+            requests_per_minute=config.LLM_REQUESTS_PER_MINUTE,
+            tokens_per_minute=config.LLM_TOKENS_PER_MINUTE,
+        ),
+        max_concurrency=config.LLM_MAX_CONCURRENCY,
+        max_retries=config.LLM_MAX_RETRIES,
+        input_token_budget=config.LLM_INPUT_TOKEN_BUDGET,
+        map_reduce_threshold_tokens=config.LLM_MAP_REDUCE_THRESHOLD_TOKENS,
+        chunk_tokens=config.LLM_CHUNK_TOKENS,
+        max_chunks=config.LLM_MAX_CHUNKS,
+    )
 
     # Initialize NewsItem service
     global news_item_service
-    news_item_service = NewsItemService(database_service, scraper, openai_service)
+    news_item_service = NewsItemService(
+        database_service,
+        scraper,
+        openai_service,
+        scrape_scheduler=ScrapeScheduler(
+            max_concurrency=config.SCRAPE_MAX_CONCURRENCY,
+            max_per_host=config.SCRAPE_MAX_PER_HOST,
+        ),
+        gnews_decoder_service=GoogleNewsDecoderService(
+            cache_path=config.GNEWS_DECODER_CACHE_PATH,
+            max_concurrency=config.GNEWS_DECODER_MAX_CONCURRENCY,
+            negative_ttl_seconds=config.GNEWS_DECODER_NEGATIVE_TTL_SECONDS,
+        ),
+        content_store_service=content_store_service,
+        category_classifier_service=(
+            CategoryClassifierService(
+                openai_service,
+                centroids_path=config.CATEGORY_CENTROIDS_PATH,
+                min_similarity=config.CATEGORY_MIN_SIMILARITY,
+                min_margin=config.CATEGORY_MIN_MARGIN,
+                batch_size=config.CATEGORY_BATCH_SIZE,
+            )
+            if config.CATEGORY_CLASSIFIER_ENABLED
+            else None
+        ),
+        near_duplicate_index=NearDuplicateIndex(
+            threshold=config.NEAR_DUPLICATE_THRESHOLD
+        ),
+        near_duplicate_seed_limit=config.NEAR_DUPLICATE_SEED_LIMIT,
+        crawl_state_service=CrawlStateService(database_service),
+        crawl_overlap_hours=config.CRAWL_OVERLAP_HOURS,
+        http_session_manager=HTTPSessionManager(
+            limit=config.HTTP_POOL_LIMIT,
+            limit_per_host=config.HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=config.HTTP_DNS_CACHE_TTL_SECONDS,
+            total_timeout=config.HTTP_TIMEOUT_SECONDS,
+            max_response_bytes=config.HTTP_MAX_RESPONSE_BYTES,
+        ),
+        google_news_max_concurrency=config.GOOGLE_NEWS_MAX_CONCURRENCY,
+        crawl_queue_size=config.CRAWL_QUEUE_SIZE,
+        crawl_batch_size=config.CRAWL_BATCH_SIZE,
+    )
+
+    # Initialize ingestion pipeline
+    global ingestion_pipeline
+    ingestion_pipeline = IngestionPipeline(
+        news_item_service,
+        decode_workers=config.INGESTION_DECODE_WORKERS,
+        scrape_workers=config.INGESTION_SCRAPE_WORKERS,
+        enrich_workers=config.INGESTION_ENRICH_WORKERS,
+        queue_size=config.INGESTION_QUEUE_SIZE,
+    )
+
+    # Initialize background job service
+    global job_service
+    job_service = JobService(
+        max_workers=config.JOB_MAX_WORKERS,
+        max_finished_jobs=config.JOB_MAX_FINISHED_JOBS,
+    )
+
+    # Initialize periodic scheduler
+    global periodic_scheduler
+    periodic_scheduler = PeriodicScheduler(
+        job_service,
+        tick_seconds=config.SCHEDULER_TICK_SECONDS,
+        jitter_ratio=config.SCHEDULER_JITTER_RATIO,
+    )
+    periodic_scheduler.add_task(
+        "crawl-rss-feeds",
+        partial(
+            news_item_service.crawl_all_sources,
+            source_types=["rss"],
+            source_interval=timedelta(
+                minutes=config.SCHEDULER_RSS_SOURCE_INTERVAL_MINUTES
+            ),
+            max_sources=config.SCHEDULER_MAX_SOURCES_PER_CRAWL,
+        ),
+        interval_seconds=config.SCHEDULER_RSS_CRAWL_INTERVAL_MINUTES * 60,
+    )
+    periodic_scheduler.add_task(
+        "crawl-google-news",
+        partial(
+            news_item_service.crawl_all_sources,
+            source_types=["google_news"],
+            source_interval=timedelta(
+                minutes=config.SCHEDULER_GOOGLE_NEWS_SOURCE_INTERVAL_MINUTES
+            ),
+            max_sources=config.SCHEDULER_MAX_SOURCES_PER_CRAWL,
+        ),
+        interval_seconds=config.SCHEDULER_GOOGLE_NEWS_CRAWL_INTERVAL_MINUTES * 60,
+    )
+    periodic_scheduler.add_task(
+        "scrape-articles",
+        news_item_service.scrape_articles,
+        interval_seconds=config.SCHEDULER_SCRAPE_INTERVAL_MINUTES * 60,
+    )
+    periodic_scheduler.add_task(
+        "generate-content",
+        news_item_service.enrich_articles,
+        interval_seconds=config.SCHEDULER_ENRICH_INTERVAL_MINUTES * 60,
+    )
+    if start_scheduler and config.SCHEDULER_ENABLED:
+        periodic_scheduler.start()
 
     # Register blueprints
     from .routes import client_routes, api_routes
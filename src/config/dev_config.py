@@ -4,3 +4,93 @@ class DevConfig:
         self.DEBUG = True
         self.PORT = 5000
         self.HOST = "0.0.0.0"
+
+        # Scraping: concurrent scrapes (also the most pages open in the shared browser)
+        # and concurrent scrapes per host
+        self.SCRAPE_MAX_CONCURRENCY = 5
+        self.SCRAPE_MAX_PER_HOST = 2
+
+        # Google News URL decoding
+        self.GNEWS_DECODER_CACHE_PATH = "gnews_decoder_cache.sqlite"
+        self.GNEWS_DECODER_MAX_CONCURRENCY = 4
+        self.GNEWS_DECODER_NEGATIVE_TTL_SECONDS = 24 * 60 * 60
+
+        # LLM results cache
+        self.LLM_CACHE_PATH = "llm_cache.sqlite"
+        self.LLM_CACHE_MAX_SIZE_BYTES = 50 * 1024 * 1024
+
+        # LLM rate limits and retries
+        self.LLM_REQUESTS_PER_MINUTE = 500
+        self.LLM_TOKENS_PER_MINUTE = 30000
+        self.LLM_MAX_CONCURRENCY = 8
+        self.LLM_MAX_RETRIES = 5
+
+        # LLM input size: texts are trimmed to the token budget, and texts over the
+        # map-reduce threshold are summarized in chunks first
+        self.LLM_INPUT_TOKEN_BUDGET = 3000
+        self.LLM_MAP_REDUCE_THRESHOLD_TOKENS = 12000
+        self.LLM_CHUNK_TOKENS = 3000
+        self.LLM_MAX_CHUNKS = 8
+
+        # Local category classifier: predictions below the similarity or margin
+        # thresholds, and batches whose embeddings request fails, fall back to the LLM
+        self.CATEGORY_CLASSIFIER_ENABLED = True
+        self.CATEGORY_CENTROIDS_PATH = "category_centroids.npz"
+        self.CATEGORY_MIN_SIMILARITY = 0.3
+        self.CATEGORY_MIN_MARGIN = 0.05
+        self.CATEGORY_BATCH_SIZE = 64
+
+        # Near-duplicate clustering at ingest: items at least this similar (estimated
+        # Jaccard similarity of title and summary) to an earlier item are duplicates
+        self.NEAR_DUPLICATE_THRESHOLD = 0.6
+        self.NEAR_DUPLICATE_SEED_LIMIT = 2000
+
+        # Incremental crawling: searches and feed entries cover the time since the
+        # last successful crawl of each source, plus this overlap
+        self.CRAWL_OVERLAP_HOURS = 24
+
+        # Shared HTTP session for crawling feeds
+        self.HTTP_POOL_LIMIT = 100
+        # Google News searches all go to one host, so keep this at least
+        # GOOGLE_NEWS_MAX_CONCURRENCY, or the lower of the two limits wins
+        self.HTTP_POOL_LIMIT_PER_HOST = 8
+        self.HTTP_DNS_CACHE_TTL_SECONDS = 300
+        self.HTTP_TIMEOUT_SECONDS = 30
+        self.HTTP_MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+        # Concurrent Google News searches
+        self.GOOGLE_NEWS_MAX_CONCURRENCY = 8
+
+        # Streaming crawl: crawl results buffered between sources and processing, and
+        # the most results processed together
+        self.CRAWL_QUEUE_SIZE = 100
+        self.CRAWL_BATCH_SIZE = 20
+
+        # Ingestion pipeline: workers per stage, and the size of the queue in front
+        # of each stage
+        self.INGESTION_DECODE_WORKERS = 4
+        self.INGESTION_SCRAPE_WORKERS = 5
+        self.INGESTION_ENRICH_WORKERS = 8
+        self.INGESTION_QUEUE_SIZE = 50
+
+        # Background jobs: worker threads running long API operations, and finished
+        # jobs kept for status requests. Shared clients (scraper, HTTP session) are
+        # bound to one event loop at a time, so jobs run one after another by default
+        self.JOB_MAX_WORKERS = 1
+        self.JOB_MAX_FINISHED_JOBS = 100
+
+        # Periodic scheduler for crawling, scraping and enrichment, run in the web app
+        # when enabled (or standalone with src/scripts/run_scheduler.py). Each run is
+        # delayed by a random jitter of up to SCHEDULER_JITTER_RATIO of its interval.
+        # Crawl runs only cover sources not crawled within their source interval, at
+        # most SCHEDULER_MAX_SOURCES_PER_CRAWL per source type, least recent first
+        self.SCHEDULER_ENABLED = False
+        self.SCHEDULER_TICK_SECONDS = 30
+        self.SCHEDULER_JITTER_RATIO = 0.1
+        self.SCHEDULER_RSS_CRAWL_INTERVAL_MINUTES = 5
+        self.SCHEDULER_RSS_SOURCE_INTERVAL_MINUTES = 15
+        self.SCHEDULER_GOOGLE_NEWS_CRAWL_INTERVAL_MINUTES = 10
+        self.SCHEDULER_GOOGLE_NEWS_SOURCE_INTERVAL_MINUTES = 60
+        self.SCHEDULER_MAX_SOURCES_PER_CRAWL = 25
+        self.SCHEDULER_SCRAPE_INTERVAL_MINUTES = 10
+        self.SCHEDULER_ENRICH_INTERVAL_MINUTES = 15
@@ -1,10 +1,11 @@
-from pydantic import BaseModel, Field, ValidationError
-from typing import Optional
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
+from typing import Callable, ClassVar, Optional
 
 from .utils import (
     standardize_date_type_format,
     clean_and_normalize_text,
     normalize_html_content,
+    get_text_cleaning_version,
 )
 
 
@@ -38,14 +39,44 @@ class NewsItemSchema(BaseModel):
     extracted_news_source: Optional[str] = Field(None, description="News source")
     extracted_author: Optional[str] = Field(None, description="Author of the article")
     extracted_summary: Optional[str] = Field(None, description="Extracted summary")
+    crawl_search_queries: Optional[list[str]] = Field(
+        None, description="Search queries that surfaced the article in its crawl"
+    )
 
     crawl4ai_result: Optional[dict] = Field(
-        None, description="Result from crawl4ai scraper"
+        None, description="Inline crawl4ai scraper result (before the content store)"
+    )
+    content_hash: Optional[str] = Field(
+        None, description="Hash of the crawl4ai scraper result in the content store"
+    )
+
+    duplicate_of_data_URL: Optional[str] = Field(
+        None,
+        description="data_URL of the canonical item of its near-duplicate cluster, null if canonical",
     )
 
     generated_category: Optional[str] = Field(None, description="AI-Generated category")
     generated_summary: Optional[str] = Field(None, description="AI-Generated summary")
 
+    # display fields, precomputed when an item is ingested, scraped or summarized
+    display_date_published: Optional[str] = Field(
+        None, description="Formatted date published for display"
+    )
+    display_summary: Optional[str] = Field(
+        None, description="Cleaned summary for display"
+    )
+    is_article_text_available: Optional[bool] = Field(
+        None, description="Scraped article text is available"
+    )
+
+    # Loads scraped content from the content store by hash, set when the app is created
+    _content_loader: ClassVar[Optional[Callable[[str], Optional[dict]]]] = None
+    _scraped_content: Optional[dict] = PrivateAttr(default=None)
+
+    @classmethod
+    def set_content_loader(cls, content_loader: Callable[[str], Optional[dict]]):
+        cls._content_loader = content_loader
+
     def get_json(self) -> dict:
         return self.model_dump(exclude_unset=True)
 
@@ -59,7 +90,15 @@ class NewsItemSchema(BaseModel):
 
     def get_date_published(self):
         """
-        Retrieve the date published. If extracted_date_published is null/empty,
+        Retrieve the date published, precomputed in display_date_published if available.
+        """
+        if self.display_date_published:
+            return self.display_date_published
+        return self._compute_date_published()
+
+    def _compute_date_published(self):
+        """
+        Format the date published. If extracted_date_published is null/empty,
         fallback to data_json.published (if it exists).
         """
         if self.extracted_date_published:
@@ -113,7 +152,15 @@ class NewsItemSchema(BaseModel):
 
     def get_article_summary(self):
         """
-        Retrieve the article summary.
+        Retrieve the article summary, precomputed in display_summary if available.
+        """
+        if self.display_summary:
+            return self.display_summary
+        return self._compute_article_summary()
+
+    def _compute_article_summary(self):
+        """
+        Clean the article summary for display.
         """
         if self.extracted_summary:
             return clean_and_normalize_text(self.extracted_summary)
@@ -131,14 +178,73 @@ class NewsItemSchema(BaseModel):
 
         return None
 
-    def get_article_text(self):
+    def set_scraped_content(self, content: dict, content_hash: str):
+        """
+        Reference scraped content stored in the content store, keeping it loaded.
+        """
+        self.content_hash = content_hash
+        self.crawl4ai_result = None
+        self._scraped_content = content
+
+    def get_scraped_content(self) -> Optional[dict]:
+        """
+        Retrieve the crawl4ai scraper result, loading it from the content store on first use.
+        """
         if self.crawl4ai_result:
-            return normalize_html_content(
-                self.crawl4ai_result.get("fit_html", "cleaned_html")
-            )
+            return self.crawl4ai_result
+
+        if self._scraped_content is None and self.content_hash:
+            if NewsItemSchema._content_loader:
+                self._scraped_content = NewsItemSchema._content_loader(
+                    self.content_hash
+                )
+        return self._scraped_content
+
+    @staticmethod
+    def compute_article_text(scraped_content: dict) -> str:
+        """
+        Normalize the text of a crawl4ai scraper result.
+        """
+        return normalize_html_content(
+            scraped_content.get("fit_html") or scraped_content.get("cleaned_html") or ""
+        )
+
+    def get_article_text(self):
+        """
+        Retrieve the article text, precomputed in the scraped content's article_text if
+        available and cleaned with the current text cleaning rules.
+        """
+        scraped_content = self.get_scraped_content()
+        if scraped_content:
+            if (
+                scraped_content.get("article_text") is not None
+                and scraped_content.get("article_text_version")
+                == get_text_cleaning_version()
+            ):
+                return scraped_content["article_text"]
+            return self.compute_article_text(scraped_content)
         # return "This article was not scraped to retrieve its text."
         return None
 
+    def has_article_text(self) -> bool:
+        if self.is_article_text_available is not None:
+            return self.is_article_text_available
+        return bool(self.get_article_text())
+
+    def refresh_display_fields(self):
+        """
+        Precompute the display fields, so they are served directly when rendering.
+        Call this whenever the fields they are derived from change.
+        """
+        self.display_date_published = self._compute_date_published()
+        self.display_summary = self._compute_article_summary()
+        self.is_article_text_available = self._compute_is_article_text_available()
+
+    def _compute_is_article_text_available(self) -> bool:
+        if self.content_hash or self.crawl4ai_result:
+            return bool(self.get_article_text())
+        return False
+
     def get_category(self):
         if self.generated_category:
             return self.generated_category
@@ -158,3 +264,83 @@ class NewsItemSchema(BaseModel):
     #     relevant_information += f"Summary: {self.get_article_summary()}\n"
 
     #     return relevant_information
+
+
+# Columns needed to render news items in list views, leaving out data_json and any
+# inline crawl4ai_result body. Only the content hash and the small scraped metadata
+# are kept, to tell if an item was scraped.
+NEWS_ITEM_LIST_COLUMNS = ",".join(
+    [
+        "id",
+        "data_source_type",
+        "data_URL",
+        "is_selected_for_download",
+        "is_removed_from_display",
+        "extracted_URL",
+        "extracted_date_published",
+        "extracted_title",
+        "extracted_news_source",
+        "extracted_author",
+        "extracted_summary",
+        "duplicate_of_data_URL",
+        "generated_category",
+        "generated_summary",
+        "display_date_published",
+        "display_summary",
+        "is_article_text_available",
+        "content_hash",
+        "crawl4ai_metadata:crawl4ai_result->metadata",
+    ]
+)
+
+
+class NewsItemListSchema(NewsItemSchema):
+    """
+    Lightweight read model for list views, built from rows selected with NEWS_ITEM_LIST_COLUMNS.
+    The article body is not loaded; fetch the full NewsItemSchema when it is needed.
+    """
+
+    data_source_type: Optional[str] = Field(
+        None, description="Type of data source (e.g., RSS Feed)"
+    )
+    data_json: Optional[dict] = Field(None, description="Not loaded in list views")
+
+    crawl4ai_metadata: Optional[dict] = Field(
+        None, description="Metadata from crawl4ai scraper"
+    )
+
+    def get_article_text(self):
+        # The article body is not loaded in list views
+        return None
+
+    def has_article_text(self) -> bool:
+        if self.is_article_text_available is not None:
+            return self.is_article_text_available
+        return self._compute_is_article_text_available()
+
+    def _compute_is_article_text_available(self) -> bool:
+        # Without the body, any scraped item is assumed to have text
+        return self.content_hash is not None or self.crawl4ai_metadata is not None
+
+
+class CrawlSourceStateSchema(BaseModel):
+    """
+    Crawl state of one source (an RSS feed, or a Google News query), so crawls only
+    fetch what changed since the last successful run.
+    """
+
+    __tablename__ = "crawl_source_states"
+
+    source_key: str = Field(
+        ..., unique=True, description="Source key, e.g. rss:<feed URL>"
+    )
+    etag: Optional[str] = Field(None, description="ETag of the last feed response")
+    last_modified: Optional[str] = Field(
+        None, description="Last-Modified header of the last feed response"
+    )
+    last_seen_published_at: Optional[str] = Field(
+        None, description="Latest publication time (ISO 8601) of a crawled entry"
+    )
+    last_successful_run_at: Optional[str] = Field(
+        None, description="Time (ISO 8601) of the last successful crawl"
+    )
@@ -1,19 +1,27 @@
+import json
+import time
+
 from flask import (
     Blueprint,
+    Response,
     request,
     render_template,
     jsonify,
     session,
     redirect,
     url_for,
+    stream_with_context,
 )
 from functools import wraps
 from .app import (
     database_service,
     # auth_service,
     news_item_service,
+    ingestion_pipeline,
+    job_service,
+    periodic_scheduler,
 )
-from .models import NewsItemSchema
+from .models import NEWS_ITEM_LIST_COLUMNS, NewsItemListSchema
 
 # Blueprints
 client_routes = Blueprint("client_routes", __name__)
@@ -48,31 +56,37 @@ def getting_news():
 @client_routes.route("/news-items-on-display", methods=["GET"])
 def news_items_on_display():
     page = request.args.get("page", 1, type=int)
+    cursor = request.args.get("cursor")
     per_page = 15
 
+    # Near duplicates are shown through their canonical item only
+    filters = {
+        "is_removed_from_display": False,
+        "duplicate_of_data_URL": "null",
+    }
+    total_count = database_service.count_news_items(filters=filters)
+
+    # id breaks ties between equal dates, as required for keyset pagination
     db_query = database_service.query_select_news_items_from_db(
-        filters={
-            "is_removed_from_display": False,
-        }
+        filters=filters, sort={"id": "desc"}, columns=NEWS_ITEM_LIST_COLUMNS
     )
-    db_query_response = db_query.execute()
-
-    total_count = 0
-    if db_query_response.data:
-        total_count = len(db_query_response.data)
-
     paginated_query = database_service.paginate_query(
         db_query,
         page=page,
         per_page=per_page,
+        cursor=cursor,
     )
     paginated_news_items = []
     paginated_query_response = paginated_query.execute()
     if paginated_query_response.data:
         paginated_news_items = [
-            NewsItemSchema(**item) for item in paginated_query_response.data
+            NewsItemListSchema(**item) for item in paginated_query_response.data
         ]
 
+    next_cursor = None
+    if len(paginated_news_items) == per_page:
+        next_cursor = database_service.encode_cursor(paginated_news_items[-1])
+
     total_pages = (total_count + per_page - 1) // per_page
 
     return render_template(
@@ -81,8 +95,9 @@ def news_items_on_display():
         page=page,
         total_count=total_count,
         total_pages=total_pages,
-        pagination_url=lambda page: url_for(
-            "client_routes.news_items_on_display", page=page
+        next_cursor=next_cursor,
+        pagination_url=lambda page, cursor=None: url_for(
+            "client_routes.news_items_on_display", page=page, cursor=cursor
         ),
         title="News Items on Display",
         show_actions_button=True,
@@ -94,13 +109,11 @@ def all_news_items():
     page = request.args.get("page", 1, type=int)
     per_page = 15
 
-    db_query = database_service.query_select_news_items_from_db(sort={"id": "asc"})
-    db_query_response = db_query.execute()
-
-    total_count = 0
-    if db_query_response.data:
-        total_count = len(db_query_response.data)
+    total_count = database_service.count_news_items()
 
+    db_query = database_service.query_select_news_items_from_db(
+        sort={"id": "asc"}, columns=NEWS_ITEM_LIST_COLUMNS
+    )
     paginated_query = database_service.paginate_query(
         db_query,
         page=page,
@@ -110,7 +123,7 @@ def all_news_items():
     paginated_query_response = paginated_query.execute()
     if paginated_query_response.data:
         paginated_news_items = [
-            NewsItemSchema(**item) for item in paginated_query_response.data
+            NewsItemListSchema(**item) for item in paginated_query_response.data
         ]
 
     total_pages = (total_count + per_page - 1) // per_page
@@ -121,86 +134,166 @@ def all_news_items():
         page=page,
         total_count=total_count,
         total_pages=total_pages,
-        pagination_url=lambda page: url_for("client_routes.all_news_items", page=page),
+        next_cursor=None,
+        pagination_url=lambda page, cursor=None: url_for(
+            "client_routes.all_news_items", page=page, cursor=cursor
+        ),
         title="All News Items",
         show_actions_button=False,
     )
 
 
-@api_routes.route("/crawl-for-news", methods=["GET"])
-async def crawl_for_news():
-    if request.method == "GET":
-        articles = await news_item_service.crawl_all_sources()
-        return (
-            jsonify(
-                {
-                    "message": "Articles with the following IDs have been crawled and added to the database.",
-                    "data": articles,
-                }
-            ),
-            200,
-        )
-    return jsonify({"error": "Invalid request method"}), 405
-
-
-@api_routes.route("/scrape-articles", methods=["GET"])
-async def scrape_articles():
+def submit_job(name: str, operation, message: str):
     """
-    Endpoint to scrape articles that require scraping.
+    Run an operation as a background job and respond with where to follow it.
     """
     try:
-        articles = await news_item_service.scrape_articles()
+        job = job_service.submit(name, operation)
         return (
             jsonify(
                 {
-                    "message": "Articles with the following IDs have been scraped and updated in the database.",
-                    "data": articles,
+                    "message": message,
+                    "data": {
+                        "job_id": job.id,
+                        "status": job.status.value,
+                        "status_url": url_for("api_routes.get_job", job_id=job.id),
+                    },
                 }
             ),
-            200,
+            202,
         )
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
 
+@api_routes.route("/crawl-for-news", methods=["GET"])
+def crawl_for_news():
+    """
+    Endpoint to crawl all sources for new articles, as a background job.
+    The job result is the IDs of the articles added to the database.
+    """
+    return submit_job(
+        "crawl-for-news",
+        news_item_service.crawl_all_sources,
+        "Crawling for new articles has started.",
+    )
+
+
+@api_routes.route("/scrape-articles", methods=["GET"])
+def scrape_articles():
+    """
+    Endpoint to scrape articles that require scraping, as a background job.
+    """
+    return submit_job(
+        "scrape-articles",
+        news_item_service.scrape_articles,
+        "Scraping articles has started.",
+    )
+
+
 @api_routes.route("/generate-categories", methods=["GET"])
-async def generate_categories():
+def generate_categories():
     """
-    Endpoint to generate content for articles that require it.
+    Endpoint to generate categories for articles that require them, as a background job.
     """
-    try:
-        articles = await news_item_service.categorize_articles()
-        return (
-            jsonify(
-                {
-                    "message": "Content for articles with the following IDs have been generated and updated in the database.",
-                    "data": articles,
-                }
-            ),
-            200,
-        )
-    except Exception as e:
-        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
+    return submit_job(
+        "generate-categories",
+        news_item_service.categorize_articles,
+        "Generating categories has started.",
+    )
 
 
 @api_routes.route("/generate-summaries", methods=["GET"])
-async def generate_summaries():
+def generate_summaries():
     """
-    Endpoint to generate content for articles that require it.
+    Endpoint to generate summaries for articles that require them, as a background job.
     """
-    try:
-        articles = await news_item_service.summarize_articles()
-        return (
-            jsonify(
-                {
-                    "message": "Content for articles with the following IDs have been generated and updated in the database.",
-                    "data": articles,
-                }
-            ),
-            200,
-        )
-    except Exception as e:
-        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
+    return submit_job(
+        "generate-summaries",
+        news_item_service.summarize_articles,
+        "Generating summaries has started.",
+    )
+
+
+@api_routes.route("/generate-content", methods=["GET"])
+def generate_content():
+    """
+    Endpoint to generate summaries and categories for articles that require them,
+    with one LLM call per article, as a background job.
+    """
+    return submit_job(
+        "generate-content",
+        news_item_service.enrich_articles,
+        "Generating content has started.",
+    )
+
+
+@api_routes.route("/ingest-news", methods=["GET"])
+def ingest_news():
+    """
+    Endpoint to crawl for new articles and decode, scrape and enrich each of them
+    as soon as it is crawled, as a background job.
+    """
+    return submit_job(
+        "ingest-news",
+        ingestion_pipeline.run,
+        "Crawling, scraping and enriching new articles has started.",
+    )
+
+
+@api_routes.route("/jobs", methods=["GET"])
+def list_jobs():
+    """
+    Endpoint to list background jobs, most recent first.
+    """
+    return jsonify({"data": [job.to_dict() for job in job_service.list_jobs()]}), 200
+
+
+@api_routes.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id: str):
+    """
+    Endpoint to get the status, progress and result of a background job.
+    """
+    job = job_service.get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found."}), 404
+    return jsonify({"data": job.to_dict()}), 200
+
+
+@api_routes.route("/jobs/<job_id>/events", methods=["GET"])
+def stream_job_events(job_id: str):
+    """
+    Endpoint streaming the state of a background job as server-sent events, on
+    every change until the job finishes.
+    """
+    job = job_service.get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found."}), 404
+
+    def generate_events():
+        last_version = None
+        while True:
+            version, is_finished = job.version, job.is_finished()
+            if version != last_version:
+                last_version = version
+                yield f"data: {json.dumps(job.to_dict())}\n\n"
+            if is_finished:
+                break
+            time.sleep(1)
+
+    return Response(
+        stream_with_context(generate_events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@api_routes.route("/scheduler", methods=["GET"])
+def get_scheduler_tasks():
+    """
+    Endpoint to list the periodic scheduler's tasks with their last-run timings.
+    """
+    return jsonify({"data": periodic_scheduler.get_task_timings()}), 200
 
 
 @api_routes.route("/remove_article/<int:article_id>", methods=["POST"])
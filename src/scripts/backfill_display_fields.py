@@ -0,0 +1,29 @@
+"""
+Precompute the display fields (display_date_published, display_summary and
+is_article_text_available) of news items ingested before they existed.
+
+Run from the project root:
+    python -m src.scripts.backfill_display_fields [page_size]
+"""
+
+import sys
+
+from dotenv import load_dotenv
+
+from src import app as app_module
+
+load_dotenv()
+
+
+def main():
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    app_module.create_app()
+    updated_ids = app_module.news_item_service.backfill_display_fields(
+        page_size=page_size
+    )
+    print(f"Backfilled the display fields of {len(updated_ids)} articles.")
+
+
+if __name__ == "__main__":
+    main()
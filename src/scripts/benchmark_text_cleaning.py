@@ -0,0 +1,87 @@
+"""
+Micro-benchmark of the text cleaning engine against the previous implementation,
+which ran one re.sub pass per rule.
+
+Run from the project root:
+    python -m src.scripts.benchmark_text_cleaning
+"""
+
+import random
+import re
+import timeit
+
+from src.utils.text_processing import (
+    BOILERPLATE_PHRASES,
+    PLATFORM_KEYWORDS,
+    filter_text_for_llm,
+)
+
+PARAGRAPHS = [
+    "The province announced new funding for accessory dwelling units on Tuesday, "
+    "aiming to add thousands of homes over the next five years.",
+    "Municipal councils across Ontario have been updating zoning bylaws to allow "
+    "multiplex conversions on lots previously reserved for single-family homes.",
+    "Builders say construction costs and interest rates remain the biggest barriers "
+    "to middle housing, even as demand from first-time buyers grows.",
+    "The federal Housing Accelerator Fund has signed agreements with more than "
+    "170 communities, according to the Canada Mortgage and Housing Corporation.",
+    "Analysts expect housing starts to recover gradually as borrowing costs ease "
+    "and more municipalities approve gentle density.",
+]
+
+BOILERPLATE = [
+    "You can save this article by registering for freehere.",
+    "Postmedia may earn an affiliate commission from purchases made through links on this page.",
+    "Please keep comments relevant and respectful.",
+    "Comments may take up to an hour to appear on the site.",
+    "Twitter: https://twitter.com/example",
+    "Visit https://example.com/housing?utm_source=feed for details.",
+    "Click here to read more.",
+    "Written by Staff Reporter",
+]
+
+
+def legacy_filter_text_for_llm(text):
+    """Previous implementation, recompiling and applying each pattern separately."""
+    platform_pattern = rf'\b(?:{"|".join(PLATFORM_KEYWORDS)})\s*:\s*(https?://\S+)?'
+    text = re.sub(platform_pattern, "", text)
+    text = re.sub(r"https?://\S+", "", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    for pattern in BOILERPLATE_PHRASES:
+        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def build_article(rng: random.Random, paragraph_count: int) -> str:
+    blocks = []
+    for _ in range(paragraph_count):
+        blocks.append(rng.choice(PARAGRAPHS))
+        if rng.random() < 0.3:
+            blocks.append(rng.choice(BOILERPLATE))
+    return "\n\n".join(blocks)
+
+
+def main(article_count: int = 200, repeat: int = 5):
+    rng = random.Random(42)
+    articles = [build_article(rng, rng.randint(10, 60)) for _ in range(article_count)]
+    total_kb = sum(len(article) for article in articles) / 1024
+
+    for name, function in [
+        ("legacy (one pass per rule)", legacy_filter_text_for_llm),
+        ("engine (combined pattern)", filter_text_for_llm),
+    ]:
+        seconds = min(
+            timeit.repeat(
+                lambda: [function(article) for article in articles],
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(
+            f"{name:<28} {seconds * 1000:8.1f} ms for {article_count} articles "
+            f"({total_kb:.0f} KB), {seconds / article_count * 1e6:7.1f} us/article"
+        )
+
+
+if __name__ == "__main__":
+    main()
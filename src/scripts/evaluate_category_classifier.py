@@ -0,0 +1,85 @@
+"""
+Evaluate the local category classifier against already-categorized articles.
+Fits centroids on a training split, then reports, on the held-out split, how many
+articles would be categorized locally (coverage) and how often the local
+prediction agrees with the stored category. Use --save to fit on every article
+and save the centroids for the app.
+
+Run from the project root:
+    python -m src.scripts.evaluate_category_classifier [test_fraction] [--save]
+"""
+
+import asyncio
+import random
+import sys
+
+import numpy as np
+from dotenv import load_dotenv
+
+from src import app as app_module
+from src.services.openai_service import categories
+
+load_dotenv()
+
+
+async def evaluate(test_fraction: float, save: bool):
+    news_item_service = app_module.news_item_service
+    classifier = news_item_service.category_classifier_service
+
+    articles = news_item_service.fetch_categorized_articles()
+    if len(articles) < 2:
+        print("Not enough categorized articles to evaluate.")
+        return
+    random.Random(0).shuffle(articles)
+    texts = [news_item_service._get_classification_text(a) for a in articles]
+    labels = np.asarray([article.generated_category for article in articles])
+    embeddings = await classifier._embed(texts)
+
+    test_size = max(1, int(len(articles) * test_fraction))
+    train_labels, test_labels = labels[test_size:], labels[:test_size]
+    await classifier.get_centroids()
+    centroids = classifier.fit_embeddings(embeddings[test_size:], list(train_labels))
+    best_indices, similarities, margins = classifier.predict_embeddings(
+        embeddings[:test_size], centroids
+    )
+    predicted_labels = np.asarray(categories)[best_indices]
+    confident = np.asarray(
+        [classifier.is_confident(s, m) for s, m in zip(similarities, margins)]
+    )
+    correct = predicted_labels == test_labels
+
+    print(f"Trained on {len(train_labels)} articles, tested on {test_size}")
+    print(f"Accuracy (all predictions): {correct.mean():.1%}")
+    print(
+        f"Coverage (categorized locally): {confident.mean():.1%} "
+        f"({confident.sum()} of {test_size}, the rest would use the LLM)"
+    )
+    if confident.any():
+        print(f"Accuracy (local predictions): {correct[confident].mean():.1%}")
+    for category in categories:
+        category_mask = test_labels == category
+        if category_mask.any():
+            print(
+                f"  {category}: {correct[category_mask].mean():.1%} "
+                f"of {category_mask.sum()}"
+            )
+
+    if save:
+        classifier.fit_embeddings(embeddings, list(labels))
+        classifier.save_centroids()
+        print(f"Saved centroids to {classifier.centroids_path}")
+
+
+def main():
+    arguments = [argument for argument in sys.argv[1:] if argument != "--save"]
+    test_fraction = float(arguments[0]) if arguments else 0.2
+
+    app_module.create_app()
+    if not app_module.news_item_service.category_classifier_service:
+        print("The category classifier is disabled (CATEGORY_CLASSIFIER_ENABLED).")
+        return
+    asyncio.run(evaluate(test_fraction, save="--save" in sys.argv))
+
+
+if __name__ == "__main__":
+    main()
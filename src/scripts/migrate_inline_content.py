@@ -0,0 +1,23 @@
+"""
+Move scraped article bodies still stored inline in crawl4ai_result into the
+content store, for news items scraped before the content store existed.
+
+Run from the project root:
+    python -m src.scripts.migrate_inline_content
+"""
+
+from dotenv import load_dotenv
+
+from src import app as app_module
+
+load_dotenv()
+
+
+def main():
+    app_module.create_app()
+    migrated_ids = app_module.news_item_service.migrate_inline_content_to_store()
+    print(f"Moved the content of {len(migrated_ids)} articles into the content store.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Local stand-in for the OpenAI Files and Batch APIs, for testing batch mode without
+calling OpenAI. Each batch reports "in_progress" once, then "completed", and every
+request gets a deterministic analysis built from its input text.
+
+Run from the project root:
+    python -m src.scripts.openai_batch_stub_server
+and point the app at it with:
+    LLM_ENDPOINT=http://localhost:8001/v1
+"""
+
+import json
+import time
+import uuid
+
+from flask import Flask, Response, jsonify, request
+
+from src.services.openai_service import categories
+
+app = Flask(__name__)
+
+files: dict[str, dict] = {}
+batches: dict[str, dict] = {}
+
+
+def _create_file(content: str, filename: str, purpose: str) -> dict:
+    file_id = f"file-{uuid.uuid4().hex}"
+    files[file_id] = {
+        "id": file_id,
+        "object": "file",
+        "bytes": len(content.encode("utf-8")),
+        "created_at": int(time.time()),
+        "filename": filename,
+        "purpose": purpose,
+        "status": "processed",
+        "content": content,
+    }
+    return files[file_id]
+
+
+def _public_file(file: dict) -> dict:
+    return {key: value for key, value in file.items() if key != "content"}
+
+
+def _complete_request(batch_request: dict) -> dict:
+    """
+    Build a deterministic chat completion for one batch request line.
+    """
+    user_message = batch_request["body"]["messages"][-1]["content"]
+    analysis = {
+        "summary": f"Stub summary: {user_message[8:208].strip()}",
+        "category": categories[len(user_message) % len(categories)],
+    }
+    return {
+        "id": f"batch_req_{uuid.uuid4().hex}",
+        "custom_id": batch_request["custom_id"],
+        "response": {
+            "status_code": 200,
+            "request_id": uuid.uuid4().hex,
+            "body": {
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": batch_request["body"]["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": "assistant",
+                            "content": json.dumps(analysis),
+                        },
+                        "finish_reason": "stop",
+                    }
+                ],
+            },
+        },
+        "error": None,
+    }
+
+
+@app.route("/v1/files", methods=["POST"])
+def create_file():
+    uploaded_file = request.files["file"]
+    content = uploaded_file.read().decode("utf-8")
+    file = _create_file(
+        content, uploaded_file.filename or "batch.jsonl", request.form["purpose"]
+    )
+    return jsonify(_public_file(file))
+
+
+@app.route("/v1/files/<file_id>/content", methods=["GET"])
+def get_file_content(file_id):
+    if file_id not in files:
+        return jsonify({"error": {"message": "File not found"}}), 404
+    return Response(files[file_id]["content"], mimetype="application/jsonl")
+
+
+@app.route("/v1/batches", methods=["POST"])
+def create_batch():
+    data = request.get_json()
+    if data["input_file_id"] not in files:
+        return jsonify({"error": {"message": "Input file not found"}}), 404
+
+    batch_id = f"batch_{uuid.uuid4().hex}"
+    batches[batch_id] = {
+        "id": batch_id,
+        "object": "batch",
+        "endpoint": data["endpoint"],
+        "input_file_id": data["input_file_id"],
+        "completion_window": data["completion_window"],
+        "status": "validating",
+        "output_file_id": None,
+        "error_file_id": None,
+        "created_at": int(time.time()),
+        "request_counts": {"total": 0, "completed": 0, "failed": 0},
+    }
+    return jsonify(batches[batch_id])
+
+
+@app.route("/v1/batches/<batch_id>", methods=["GET"])
+def retrieve_batch(batch_id):
+    batch = batches.get(batch_id)
+    if not batch:
+        return jsonify({"error": {"message": "Batch not found"}}), 404
+
+    if batch["status"] == "validating":
+        batch["status"] = "in_progress"
+    elif batch["status"] == "in_progress":
+        input_lines = [
+            json.loads(line)
+            for line in files[batch["input_file_id"]]["content"].splitlines()
+            if line.strip()
+        ]
+        output_lines = [
+            json.dumps(_complete_request(batch_request))
+            for batch_request in input_lines
+        ]
+        output_file = _create_file(
+            "\n".join(output_lines) + "\n", f"{batch_id}_output.jsonl", "batch_output"
+        )
+        batch.update(
+            {
+                "status": "completed",
+                "output_file_id": output_file["id"],
+                "completed_at": int(time.time()),
+                "request_counts": {
+                    "total": len(input_lines),
+                    "completed": len(input_lines),
+                    "failed": 0,
+                },
+            }
+        )
+    return jsonify(batch)
+
+
+if __name__ == "__main__":
+    app.run(host="127.0.0.1", port=8001)
@@ -0,0 +1,32 @@
+"""
+Generate missing summaries and categories through the OpenAI Batch API, e.g. as a
+nightly backfill. Waits for the batch to finish before writing results back.
+
+Run from the project root:
+    python -m src.scripts.run_batch_enrichment [poll_interval_seconds]
+"""
+
+import asyncio
+import sys
+
+from dotenv import load_dotenv
+
+from src import app as app_module
+
+load_dotenv()
+
+
+def main():
+    poll_interval_seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+
+    app_module.create_app()
+    enriched_ids = asyncio.run(
+        app_module.news_item_service.enrich_articles_in_batch(
+            poll_interval_seconds=poll_interval_seconds
+        )
+    )
+    print(f"Enriched {len(enriched_ids)} articles through the Batch API.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Run the periodic scheduler (crawling, scraping and enrichment) as a standalone
+worker, e.g. alongside a web app with SCHEDULER_ENABLED off. Stop with Ctrl+C;
+a running job is finished first.
+
+Run from the project root:
+    python -m src.scripts.run_scheduler
+"""
+
+from dotenv import load_dotenv
+
+from src import app as app_module
+
+load_dotenv()
+
+
+def main():
+    app_module.create_app()
+    try:
+        app_module.periodic_scheduler.run_forever()
+    except KeyboardInterrupt:
+        print("Stopping scheduler...")
+    finally:
+        for task in app_module.periodic_scheduler.get_task_timings():
+            print(task)
+        app_module.job_service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import asyncio
+import os
+
+import numpy as np
+
+from .openai_service import OpenAIService, categories
+
+
+class CategoryClassifierService:
+    """
+    Classifies articles into the fixed categories locally, by cosine similarity of
+    their embeddings to per-category centroids. Only low-confidence predictions
+    (low similarity, or a low margin over the runner-up category) fall back to
+    the LLM.
+
+    Centroids are fitted from already-categorized articles and saved to
+    centroids_path, along with the embedding model they were fitted with (see
+    src/scripts/evaluate_category_classifier.py). Until then, or if the embedding
+    model changed since, every article is categorized by the LLM. Texts are embedded
+    batch_size per request.
+    """
+
+    def __init__(
+        self,
+        openai_service: OpenAIService,
+        centroids_path: str = "category_centroids.npz",
+        min_similarity: float = 0.3,
+        min_margin: float = 0.05,
+        batch_size: int = 64,
+    ):
+        self.openai_service = openai_service
+        self.centroids_path = centroids_path
+        self.min_similarity = min_similarity
+        self.min_margin = min_margin
+        self.batch_size = batch_size
+        self._centroids: np.ndarray | None = None
+        self._is_centroids_file_loaded = False
+        self.stats = {"local": 0, "llm": 0}
+
+    @staticmethod
+    def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    async def _embed(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts as unit-length vectors, batch_size texts per request.
+        """
+        embeddings = []
+        for start in range(0, len(texts), self.batch_size):
+            embeddings += await self.openai_service.embed_texts(
+                texts[start : start + self.batch_size]
+            )
+        return self._normalize_rows(np.asarray(embeddings, dtype=np.float32))
+
+    def _load_centroids(self) -> np.ndarray | None:
+        if not os.path.exists(self.centroids_path):
+            return None
+        saved_centroids = np.load(self.centroids_path)
+        if list(saved_centroids["categories"]) != categories:
+            print("Saved category centroids do not match the categories, ignoring them")
+            return None
+        if (
+            "embedding_model" not in saved_centroids.files
+            or str(saved_centroids["embedding_model"])
+            != self.openai_service.embedding_model
+        ):
+            print(
+                "Saved category centroids were fitted with another embedding model, "
+                "ignoring them"
+            )
+            return None
+        return saved_centroids["centroids"]
+
+    async def get_centroids(self) -> np.ndarray | None:
+        """
+        Return the (categories x dimensions) matrix of unit-length centroids, or None
+        if no usable centroids were fitted yet.
+        """
+        if self._centroids is None and not self._is_centroids_file_loaded:
+            self._centroids = self._load_centroids()
+            self._is_centroids_file_loaded = True
+        return self._centroids
+
+    def fit_embeddings(self, embeddings: np.ndarray, labels: list[str]) -> np.ndarray:
+        """
+        Compute the centroid of each category from labelled, unit-length embeddings.
+        Categories without examples keep their current centroid.
+        """
+        labels = np.asarray(labels)
+        centroids = (
+            self._centroids.copy()
+            if self._centroids is not None
+            else np.zeros((len(categories), embeddings.shape[1]), dtype=np.float32)
+        )
+        for category_index, category in enumerate(categories):
+            category_embeddings = embeddings[labels == category]
+            if len(category_embeddings):
+                centroids[category_index] = category_embeddings.mean(axis=0)
+        self._centroids = self._normalize_rows(centroids)
+        return self._centroids
+
+    def save_centroids(self):
+        np.savez(
+            self.centroids_path,
+            centroids=self._centroids,
+            categories=np.asarray(categories),
+            embedding_model=np.asarray(self.openai_service.embedding_model),
+        )
+
+    def predict_embeddings(self, embeddings: np.ndarray, centroids: np.ndarray):
+        """
+        Score unit-length embeddings against the centroids.
+        Returns the index of the best category, its similarity, and its margin over
+        the runner-up category, for each embedding.
+        """
+        similarities = embeddings @ centroids.T
+        top_two = np.sort(similarities, axis=1)[:, -2:]
+        best_indices = similarities.argmax(axis=1)
+        return best_indices, top_two[:, 1], top_two[:, 1] - top_two[:, 0]
+
+    def is_confident(self, similarity: float, margin: float) -> bool:
+        return similarity >= self.min_similarity and margin >= self.min_margin
+
+    async def classify_many(self, texts: list[str]) -> list[str | None]:
+        """
+        Classify texts from their embeddings, falling back to the LLM for the
+        low-confidence ones, or for all of them without fitted centroids. Raises if
+        the embeddings request fails.
+        """
+        if not texts:
+            return []
+        predicted_categories = [None] * len(texts)
+        fallback_indices = list(range(len(texts)))
+
+        centroids = await self.get_centroids()
+        embeddings = await self._embed(texts) if centroids is not None else None
+        if embeddings is not None and embeddings.shape[1] != centroids.shape[1]:
+            print(
+                "Saved category centroids do not match the embedding dimensions, "
+                "ignoring them"
+            )
+            self._centroids = centroids = None
+        if centroids is not None:
+            best_indices, similarities, margins = self.predict_embeddings(
+                embeddings, centroids
+            )
+            fallback_indices = []
+            for i, (best_index, similarity, margin) in enumerate(
+                zip(best_indices, similarities, margins)
+            ):
+                if self.is_confident(similarity, margin):
+                    predicted_categories[i] = categories[best_index]
+                else:
+                    fallback_indices.append(i)
+
+        llm_categories = await asyncio.gather(
+            *(self.openai_service.assign_category(texts[i]) for i in fallback_indices)
+        )
+        for i, category in zip(fallback_indices, llm_categories):
+            predicted_categories[i] = category
+
+        self.stats["local"] += len(texts) - len(fallback_indices)
+        self.stats["llm"] += len(fallback_indices)
+        print(
+            f"Categorized {len(texts) - len(fallback_indices)} articles locally, "
+            f"{len(fallback_indices)} with the LLM"
+        )
+        return predicted_categories
+
+    async def classify(self, text: str) -> str | None:
+        return (await self.classify_many([text]))[0]
@@ -0,0 +1,85 @@
+import base64
+import hashlib
+import json
+import zlib
+from typing import Optional
+from supabase import PostgrestAPIResponse
+
+from .database_service import SupabaseDBService
+
+
+class ContentStoreService:
+    """
+    Stores scraped article bodies outside of the news_items table.
+    Contents are keyed by the SHA-256 hash of their JSON, compressed with zlib, and
+    referenced from news items by content_hash, so identical bodies are stored once.
+
+    Expected table:
+        create table news_item_contents (
+            content_hash text primary key,
+            compressed_content text not null,
+            created_at timestamptz not null default now()
+        );
+        alter table news_items add column content_hash text
+            references news_item_contents (content_hash);
+    """
+
+    CONTENTS_TABLE = "news_item_contents"
+
+    def __init__(self, database_service: SupabaseDBService):
+        self.supabase_client = database_service.supabase_client
+
+    @staticmethod
+    def _serialize(content: dict) -> bytes:
+        return json.dumps(content, sort_keys=True, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    @staticmethod
+    def compute_content_hash(content: dict) -> str:
+        return hashlib.sha256(ContentStoreService._serialize(content)).hexdigest()
+
+    @staticmethod
+    def compress(content: dict) -> str:
+        compressed = zlib.compress(ContentStoreService._serialize(content), level=6)
+        return base64.b64encode(compressed).decode("ascii")
+
+    @staticmethod
+    def decompress(compressed_content: str) -> dict:
+        return json.loads(zlib.decompress(base64.b64decode(compressed_content)))
+
+    def put(self, content: dict) -> Optional[str]:
+        """
+        Store the content if it isn't stored yet, and return its content hash.
+        """
+        content_hash = self.compute_content_hash(content)
+        try:
+            self.supabase_client.table(self.CONTENTS_TABLE).upsert(
+                {
+                    "content_hash": content_hash,
+                    "compressed_content": self.compress(content),
+                },
+                on_conflict="content_hash",
+                ignore_duplicates=True,
+            ).execute()
+            return content_hash
+        except Exception as e:
+            print(f"Error storing content {content_hash}: {e}")
+            return None
+
+    def get(self, content_hash: str) -> Optional[dict]:
+        """
+        Load and decompress the content stored under the given hash.
+        """
+        try:
+            response: PostgrestAPIResponse = (
+                self.supabase_client.table(self.CONTENTS_TABLE)
+                .select("compressed_content")
+                .eq("content_hash", content_hash)
+                .execute()
+            )
+            if response.data:
+                return self.decompress(response.data[0]["compressed_content"])
+        except Exception as e:
+            print(f"Error loading content {content_hash}: {e}")
+        return None
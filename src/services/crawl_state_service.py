@@ -0,0 +1,65 @@
+from supabase import PostgrestAPIResponse
+
+from ..models import CrawlSourceStateSchema
+from .database_service import SupabaseDBService
+
+
+class CrawlStateService:
+    """
+    Persists per-source crawl state (conditional request validators, latest entry
+    seen and last successful run) between crawls.
+
+    Expected table:
+        create table crawl_source_states (
+            source_key text primary key,
+            etag text,
+            last_modified text,
+            last_seen_published_at timestamptz,
+            last_successful_run_at timestamptz
+        );
+    """
+
+    STATES_TABLE = "crawl_source_states"
+
+    def __init__(self, database_service: SupabaseDBService):
+        self.supabase_client = database_service.supabase_client
+
+    def get_states(self, source_keys: list[str]) -> dict[str, CrawlSourceStateSchema]:
+        """
+        Load the crawl states of the given sources. Sources never crawled get a
+        blank state.
+        """
+        states = {
+            source_key: CrawlSourceStateSchema(source_key=source_key)
+            for source_key in source_keys
+        }
+        if not source_keys:
+            return states
+        try:
+            response: PostgrestAPIResponse = (
+                self.supabase_client.table(self.STATES_TABLE)
+                .select("*")
+                .in_("source_key", source_keys)
+                .execute()
+            )
+            for row in response.data or []:
+                states[row["source_key"]] = CrawlSourceStateSchema(**row)
+        except Exception as e:
+            # Without state, sources are crawled in full
+            print(f"Error loading crawl states: {e}")
+        return states
+
+    def save_states(self, states: list[CrawlSourceStateSchema]) -> bool:
+        """
+        Insert or update the given crawl states.
+        """
+        if not states:
+            return True
+        try:
+            self.supabase_client.table(self.STATES_TABLE).upsert(
+                [state.model_dump() for state in states], on_conflict="source_key"
+            ).execute()
+            return True
+        except Exception as e:
+            print(f"Error saving crawl states: {e}")
+            return False
@@ -1,5 +1,13 @@
-from pygooglenews import GoogleNews
+import asyncio
+import contextlib
+import random
+from urllib.parse import quote_plus
+
+import feedparser
+from dateutil import parser as date_parser
+
 from ...utils import get_news_search_dates
+from .http_session import read_response_text
 
 CANADIAN_LOCATIONS = [
     "Canada",
@@ -28,13 +36,58 @@ GOOGLE_NEWS_SEARCH_QUERIES = [
     # "zoning bylaws",
 ]
 
-# Initialize GoogleNews with Canadian settings
-gn = GoogleNews(lang="en", country="CA")
+GOOGLE_NEWS_SEARCH_URL = "https://news.google.com/rss/search"
+GOOGLE_NEWS_LANGUAGE = "en"
+GOOGLE_NEWS_COUNTRY = "CA"
+
+# Responses worth retrying, with backoff
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+def build_search_url(query, from_=None, to_=None):
+    """
+    Build the Google News search RSS URL for the query, restricted to articles
+    published after from_ and before to_ (dates or date strings), if given.
+    """
+    if from_:
+        query += f" after:{date_parser.parse(str(from_)).strftime('%Y-%m-%d')}"
+    if to_:
+        query += f" before:{date_parser.parse(str(to_)).strftime('%Y-%m-%d')}"
+    return (
+        f"{GOOGLE_NEWS_SEARCH_URL}?q={quote_plus(query)}"
+        f"&hl={GOOGLE_NEWS_LANGUAGE}-{GOOGLE_NEWS_COUNTRY}&gl={GOOGLE_NEWS_COUNTRY}"
+        f"&ceid={GOOGLE_NEWS_COUNTRY}:{GOOGLE_NEWS_LANGUAGE}"
+    )
+
+
+def _get_retry_delay(response, attempt, max_backoff_seconds=60):
+    """
+    Exponential backoff with full jitter, waiting at least as long as the
+    Retry-After header of the response, if any.
+    """
+    delay = random.uniform(0, min(max_backoff_seconds, 2**attempt))
+    try:
+        delay = max(delay, float(response.headers.get("Retry-After", 0)))
+    except ValueError:
+        pass
+    return delay
 
 
-def search_news(base_query, location, from_=None, to_=None):
+async def search_news(
+    session,
+    base_query,
+    location,
+    from_=None,
+    to_=None,
+    semaphore=None,
+    max_retries=3,
+    max_bytes=None,
+):
     """
-    Search for news articles using Google News.
+    Search for news articles using the Google News search RSS feed.
+    Requests go through the given aiohttp session, under the semaphore if given, and
+    are retried with backoff when rate limited (429) or on server errors. The feed is
+    parsed in a worker thread, off the event loop. Returns None if the search failed.
     """
     if not from_ and not to_:
         today_date, six_months_ago_date = get_news_search_dates()
@@ -42,6 +95,26 @@ def search_news(base_query, location, from_=None, to_=None):
         to_ = today_date
 
     combined_query = f"{base_query} in {location}"
-    result = gn.search(combined_query, from_=from_, to_=to_)
-    print(f"Found {len(result['entries'])} articles for query: {combined_query}")
-    return result["entries"]
+    search_url = build_search_url(combined_query, from_, to_)
+    try:
+        for attempt in range(max_retries + 1):
+            async with semaphore or contextlib.nullcontext():
+                async with session.get(search_url) as response:
+                    if response.status in RETRYABLE_STATUSES and attempt < max_retries:
+                        delay = _get_retry_delay(response, attempt)
+                        print(
+                            f"Google News search returned {response.status} for query: "
+                            f"{combined_query}, retrying in {delay:.1f}s"
+                        )
+                    else:
+                        response.raise_for_status()
+                        content = await read_response_text(response, max_bytes)
+                        break
+            await asyncio.sleep(delay)
+    except Exception as e:
+        print(f"Error searching Google News for query: {combined_query}: {e}")
+        return None
+
+    result = await asyncio.to_thread(feedparser.parse, content)
+    print(f"Found {len(result.entries)} articles for query: {combined_query}")
+    return result.entries
@@ -0,0 +1,111 @@
+import asyncio
+
+import aiohttp
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+
+class ResponseTooLargeError(Exception):
+    """
+    Raised when a response body is larger than the allowed size.
+    """
+
+
+async def read_response_text(
+    response: aiohttp.ClientResponse, max_bytes: int = None
+) -> str:
+    """
+    Read the body of a response as text, failing once it exceeds max_bytes.
+    """
+    if max_bytes is not None:
+        if response.content_length and response.content_length > max_bytes:
+            raise ResponseTooLargeError(
+                f"{response.url} is {response.content_length} bytes (max {max_bytes})"
+            )
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            body.extend(chunk)
+            if len(body) > max_bytes:
+                raise ResponseTooLargeError(f"{response.url} is over {max_bytes} bytes")
+        return body.decode(response.get_encoding(), errors="replace")
+    return await response.text()
+
+
+class HTTPSessionManager:
+    """
+    Shares one pooled aiohttp session between crawler requests, e.g. across all
+    feeds of a crawl, for connection reuse (keep-alive), DNS caching and global and
+    per-host connection limits. Requests also get timeouts and a response size limit.
+
+    Sessions are bound to an event loop, so a new session is created when the running
+    loop changes (Flask runs each async view in a new loop). Call close() when a
+    crawl is done.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 4,
+        ttl_dns_cache: int = 300,
+        keepalive_timeout: float = 30,
+        total_timeout: float = 30,
+        connect_timeout: float = 10,
+        max_response_bytes: int = 5 * 1024 * 1024,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout, sock_connect=connect_timeout
+        )
+        self.max_response_bytes = max_response_bytes
+        self.user_agent = user_agent
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared session for the running event loop, creating it if needed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # A session of another (finished) loop can't be reused or closed from here
+            self._session = None
+            self._session_loop = loop
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={"User-Agent": self.user_agent},
+            )
+        return self._session
+
+    async def close(self):
+        """
+        Close the shared session and its pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def __aenter__(self):
+        await self.get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
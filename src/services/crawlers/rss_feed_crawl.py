@@ -2,6 +2,8 @@ import aiohttp
 import feedparser
 import ssl
 
+from .http_session import read_response_text
+
 # NOTE: Add RSS feeds and their sources here for crawling {source: feed_url}
 RSS_FEEDS = {
     "Canadian Mortgage Trends": "https://www.canadianmortgagetrends.com/feed/",  # works
@@ -16,27 +18,57 @@ ssl_context.check_hostname = False
 ssl_context.verify_mode = ssl.CERT_NONE
 
 
-async def fetch_feed(session, feed_url):
+async def fetch_feed(
+    session, feed_url, etag=None, last_modified=None, max_bytes=None
+):
     """
-    Fetch the RSS feed content asynchronously with optional SSL bypass.
+    Fetch the RSS feed content asynchronously with optional SSL bypass, reading at
+    most max_bytes of it.
+    With the ETag and/or Last-Modified of a previous response, the request is
+    conditional, and an unchanged feed (304 Not Modified) is returned without entries.
+    The response status, ETag and Last-Modified are set on the parsed feed.
     """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
     try:
-        async with session.get(feed_url, ssl=ssl_context) as response:
-            content = await response.text()
-            return feedparser.parse(content)
+        async with session.get(feed_url, ssl=ssl_context, headers=headers) as response:
+            if response.status == 304:
+                parsed_feed = feedparser.FeedParserDict(entries=[])
+            else:
+                content = await read_response_text(response, max_bytes)
+                parsed_feed = feedparser.parse(content)
+            parsed_feed["status"] = response.status
+            parsed_feed["etag"] = response.headers.get("ETag") or etag
+            parsed_feed["modified"] = (
+                response.headers.get("Last-Modified") or last_modified
+            )
+            return parsed_feed
     except Exception as e:
         print(f"Error fetching feed {feed_url}: {e}")
         return None
 
 
-async def extract_articles_from_feed(feed_url):
+async def extract_feed(feed_url, etag=None, last_modified=None, session_manager=None):
     """
-    Extract raw articles from a given RSS feed URL asynchronously.
+    Fetch and parse a given RSS feed URL asynchronously, conditionally if an ETag
+    or Last-Modified is given. Returns None if the feed could not be fetched.
+    With a session manager, the request goes through its shared, pooled session;
+    otherwise a one-off session is used.
     """
     try:
+        if session_manager:
+            return await fetch_feed(
+                await session_manager.get_session(),
+                feed_url,
+                etag,
+                last_modified,
+                max_bytes=session_manager.max_response_bytes,
+            )
         async with aiohttp.ClientSession() as session:
-            parsed_feed = await fetch_feed(session, feed_url)
-            return parsed_feed.entries if parsed_feed and parsed_feed.entries else []
+            return await fetch_feed(session, feed_url, etag, last_modified)
     except Exception as e:
         print(f"Error parsing feed {feed_url}: {e}")
-        return []
+        return None
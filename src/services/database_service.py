@@ -1,3 +1,5 @@
+import base64
+import json
 from supabase import create_client, Client, PostgrestAPIResponse
 from postgrest import SyncSelectRequestBuilder
 from typing import List, Optional
@@ -16,6 +18,17 @@ class DatabaseResponseStatusType(Enum):
     ERROR = "error"
 
 
+class BulkWriteOutcomeType(Enum):
+    """
+    Enum for per-row outcomes of bulk write operations.
+    """
+
+    INSERTED = "inserted"
+    UPDATED = "updated"
+    ALREADY_EXISTED = "already_existed"
+    FAILED = "failed"
+
+
 class DatabaseResponse:
     """
     Standardized response object for database operations.
@@ -36,48 +49,122 @@ class DatabaseResponse:
 
 
 class SupabaseDBService:
+    """
+    Reads and writes news items in the Supabase database.
+
+    Expected news_items columns, added to the original table:
+        alter table news_items
+            add column display_date_published text,
+            add column display_summary text,
+            add column is_article_text_available boolean;
+        alter table news_items add column "duplicate_of_data_URL" text;
+        alter table news_items add column crawl_search_queries text[];
+    """
+
     NEWS_ITEMS_TABLE = NewsItemSchema.__tablename__
 
+    # Google News URLs are long, so keep "in" filters well under URL length limits
+    DATA_URL_LOOKUP_CHUNK_SIZE = 50
+    # Rows carry crawled JSON and scraped content, so cap the size of each write request
+    BULK_WRITE_CHUNK_SIZE = 100
+
     def __init__(self, supabase_url: str, supabase_key: str):
         self.supabase_client: Client = create_client(supabase_url, supabase_key)
 
+    @staticmethod
+    def encode_cursor(news_item: NewsItemSchema) -> str:
+        """
+        Encode the keyset pagination cursor, (extracted_date_published, id), of the last
+        news item on a page into a URL-safe string.
+        """
+        cursor = json.dumps([news_item.extracted_date_published, news_item.id])
+        return base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[Optional[str], int]:
+        """
+        Decode a cursor created by encode_cursor. Raises ValueError if it is invalid.
+        """
+        try:
+            extracted_date_published, id = json.loads(
+                base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            )
+            if not isinstance(extracted_date_published, (str, type(None))):
+                raise ValueError("date is not a string")
+            return extracted_date_published, int(id)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid pagination cursor {cursor!r}: {e}") from e
+
+    @staticmethod
+    def _quote_filter_value(value: str) -> str:
+        """
+        Quote a value for use inside a PostgREST "or" filter, since dates contain commas.
+        """
+        escaped_value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped_value}"'
+
     @staticmethod
     def paginate_query(
         query: SyncSelectRequestBuilder,
         page: int = 1,
         per_page: int = 20,
+        cursor: str = None,
     ):
         """
         Paginate the query results.
+        Without a cursor, pages are selected by offset. With a cursor (see encode_cursor),
+        keyset pagination returns the rows after it, so deep pages don't degrade to large
+        offsets. An invalid cursor falls back to offset pagination. Keyset pagination
+        requires the query to be ordered by extracted_date_published descending, then
+        id descending.
         """
-        startIndex = (page - 1) * per_page
-        endIndex = startIndex + per_page - 1
+        if not cursor:
+            startIndex = (page - 1) * per_page
+            endIndex = startIndex + per_page - 1
 
-        return query.range(startIndex, endIndex)
+            return query.range(startIndex, endIndex)
 
-    # READ METHODS
-    def query_ALL_news_items_from_db(self):
-        """
-        Query all news items from the database.
-        """
-        return (
-            self.supabase_client.table(self.NEWS_ITEMS_TABLE)
-            .select("*")
-            .order("extracted_date_published", desc=True)
-        )
+        try:
+            extracted_date_published, id = SupabaseDBService.decode_cursor(cursor)
+        except ValueError as e:
+            # e.g. a hand-edited URL, served by offset instead of failing the page
+            print(f"{e}, paginating by offset")
+            return SupabaseDBService.paginate_query(query, page=page, per_page=per_page)
+
+        if extracted_date_published is None:
+            # Null dates sort first when descending, so the rest of the null dates
+            # come next, followed by every dated row
+            keyset_filter = (
+                f"and(extracted_date_published.is.null,id.lt.{id}),"
+                f"extracted_date_published.not.is.null"
+            )
+        else:
+            quoted_date = SupabaseDBService._quote_filter_value(
+                extracted_date_published
+            )
+            keyset_filter = (
+                f"extracted_date_published.lt.{quoted_date},"
+                f"and(extracted_date_published.eq.{quoted_date},id.lt.{id})"
+            )
+        return query.or_(keyset_filter).limit(per_page)
 
-    def query_select_news_items_from_db(
-        self,
+    @staticmethod
+    def _apply_query_options(
+        query,
         filters: dict = None,
         not_null_fields: List[str] = None,
         sort: dict[str:str] = None,
     ):
-        query = self.query_ALL_news_items_from_db()
-
+        """
+        Apply equality/null/membership (list value) filters, not-null filters and
+        sort order to a query.
+        """
         if filters:
             for column, value in filters.items():
                 if value == "null":
                     query = query.is_(column, "null")
+                elif isinstance(value, list):
+                    query = query.in_(column, value)
                 else:
                     query = query.eq(column, value)
 
@@ -98,6 +185,53 @@ class SupabaseDBService:
 
         return query
 
+    # READ METHODS
+    def query_ALL_news_items_from_db(self, columns: str = "*"):
+        """
+        Query all news items from the database, selecting the given columns.
+        """
+        return (
+            self.supabase_client.table(self.NEWS_ITEMS_TABLE)
+            .select(columns)
+            .order("extracted_date_published", desc=True)
+        )
+
+    def query_select_news_items_from_db(
+        self,
+        filters: dict = None,
+        not_null_fields: List[str] = None,
+        sort: dict[str:str] = None,
+        columns: str = None,
+    ):
+        """
+        Query news items with filters and sorting. columns is a PostgREST select
+        projection (e.g. NEWS_ITEM_LIST_COLUMNS), defaulting to every column.
+        """
+        return self._apply_query_options(
+            self.query_ALL_news_items_from_db(columns or "*"),
+            filters=filters,
+            not_null_fields=not_null_fields,
+            sort=sort,
+        )
+
+    def count_news_items(
+        self,
+        filters: dict = None,
+        not_null_fields: List[str] = None,
+        count_method: str = "exact",
+    ) -> int:
+        """
+        Count news items matching the filters with a head request, without transferring rows.
+        count_method can be "exact", "planned" or "estimated" for cheaper approximate counts.
+        """
+        query = self.supabase_client.table(self.NEWS_ITEMS_TABLE).select(
+            "id", count=count_method, head=True
+        )
+        response: PostgrestAPIResponse = self._apply_query_options(
+            query, filters=filters, not_null_fields=not_null_fields
+        ).execute()
+        return response.count or 0
+
     def fetch_news_items_by_id(self, id: int) -> Optional[dict]:
         """
         Fetch a news item by its ID from the database.
@@ -110,53 +244,150 @@ class SupabaseDBService:
         )
         return response.data[0] if response.data else None
 
-    def fetch_news_items_by_data_URL(self, data_URL: str) -> PostgrestAPIResponse:
+    def fetch_existing_data_URLs(
+        self, data_URLs: List[str], chunk_size: int = None
+    ) -> set[str]:
         """
-        Fetch a news item by its data_URL from the database.
+        Return the subset of the given data_URLs that already exist in the database.
+        Lookups are batched into chunked "in" filter queries instead of one query per URL.
         """
-        return (
-            self.supabase_client.table(self.NEWS_ITEMS_TABLE)
-            .select("*")
-            .eq("data_URL", data_URL)
-            .execute()
-        )
+        chunk_size = chunk_size or self.DATA_URL_LOOKUP_CHUNK_SIZE
+        unique_data_URLs = list(dict.fromkeys(url for url in data_URLs if url))
+
+        existing_data_URLs = set()
+        for start in range(0, len(unique_data_URLs), chunk_size):
+            chunk = unique_data_URLs[start : start + chunk_size]
+            response: PostgrestAPIResponse = (
+                self.supabase_client.table(self.NEWS_ITEMS_TABLE)
+                .select("data_URL")
+                .in_("data_URL", chunk)
+                .execute()
+            )
+            if response.data:
+                existing_data_URLs.update(item["data_URL"] for item in response.data)
+        return existing_data_URLs
 
     def fetch_unique_sources(self) -> List[str]:
         response = self.NEWS_ITEMS_TABLE.select("extracted_news_source").execute()
         return list(set(item["extracted_news_source"] for item in response.data))
 
     # CREATE METHODS
-    def insert_news_item(self, news_item: NewsItemSchema) -> DatabaseResponse:
+    @staticmethod
+    def _serialize_news_items_for_bulk_write(
+        news_items: List[NewsItemSchema],
+    ) -> List[dict]:
         """
-        Insert a news item into the database.
+        Serialize news items for a bulk write. PostgREST requires every row in a bulk
+        request to have the same keys, so all fields are dumped, and "id" is only kept
+        when every item has one.
         """
-        try:
-            serialized_item = news_item.get_json()
+        include_id = all(news_item.id is not None for news_item in news_items)
+        return [
+            news_item.model_dump(exclude=None if include_id else {"id"})
+            for news_item in news_items
+        ]
 
-            response: PostgrestAPIResponse = (
-                self.supabase_client.table(self.NEWS_ITEMS_TABLE)
-                .insert(serialized_item)
-                .execute()
-            )
-
-            if response.data:
-                return DatabaseResponse(
-                    status=DatabaseResponseStatusType.SUCCESS,
-                    data=NewsItemSchema(**response.data[0]),
+    def _bulk_write_news_items(
+        self,
+        news_items: List[NewsItemSchema],
+        ignore_duplicates: bool,
+        chunk_size: int = None,
+    ) -> DatabaseResponse:
+        """
+        Write news items in size-capped chunks using an upsert on data_URL.
+        With ignore_duplicates, existing rows are left untouched; otherwise they are updated.
+        The response data maps each data_URL to its BulkWriteOutcomeType under "outcomes",
+        and holds the written rows as NewsItemSchema under "news_items".
+        """
+        chunk_size = chunk_size or self.BULK_WRITE_CHUNK_SIZE
+        # Postgres rejects upserts that touch the same row twice in one statement
+        news_items = list(
+            {news_item.data_URL: news_item for news_item in news_items}.values()
+        )
+        outcomes: dict[str, BulkWriteOutcomeType] = {}
+        written_news_items: List[NewsItemSchema] = []
+        errors: List[str] = []
+
+        for start in range(0, len(news_items), chunk_size):
+            chunk = news_items[start : start + chunk_size]
+            chunk_data_URLs = [news_item.data_URL for news_item in chunk]
+            try:
+                existing_data_URLs = (
+                    set()
+                    if ignore_duplicates
+                    else self.fetch_existing_data_URLs(chunk_data_URLs)
                 )
-            else:
-                return DatabaseResponse(
-                    status=DatabaseResponseStatusType.FAILURE,
-                    message="No data inserted in the database.",
+                response: PostgrestAPIResponse = (
+                    self.supabase_client.table(self.NEWS_ITEMS_TABLE)
+                    .upsert(
+                        self._serialize_news_items_for_bulk_write(chunk),
+                        on_conflict="data_URL",
+                        ignore_duplicates=ignore_duplicates,
+                    )
+                    .execute()
                 )
+            except Exception as e:
+                errors.append(str(e))
+                for data_URL in chunk_data_URLs:
+                    outcomes[data_URL] = BulkWriteOutcomeType.FAILED
+                continue
+
+            returned_data_URLs = set()
+            for item in response.data or []:
+                written_news_items.append(NewsItemSchema(**item))
+                returned_data_URLs.add(item["data_URL"])
+
+            for data_URL in chunk_data_URLs:
+                if data_URL not in returned_data_URLs:
+                    # Only rows that were actually written are returned by PostgREST
+                    outcomes[data_URL] = BulkWriteOutcomeType.ALREADY_EXISTED
+                elif data_URL in existing_data_URLs:
+                    outcomes[data_URL] = BulkWriteOutcomeType.UPDATED
+                else:
+                    outcomes[data_URL] = BulkWriteOutcomeType.INSERTED
 
-        except Exception as e:
+        data = {"outcomes": outcomes, "news_items": written_news_items}
+        if errors and all(
+            outcome == BulkWriteOutcomeType.FAILED for outcome in outcomes.values()
+        ):
             return DatabaseResponse(
                 status=DatabaseResponseStatusType.ERROR,
-                message=f"Error inserting in database: {e}",
+                data=data,
+                message=f"Error writing in database: {'; '.join(errors)}",
             )
+        return DatabaseResponse(
+            status=DatabaseResponseStatusType.SUCCESS,
+            data=data,
+            message=(
+                f"Error writing some chunks in database: {'; '.join(errors)}"
+                if errors
+                else None
+            ),
+        )
+
+    def insert_news_items_bulk(
+        self, news_items: List[NewsItemSchema], chunk_size: int = None
+    ) -> DatabaseResponse:
+        """
+        Insert news items in chunks, skipping rows whose data_URL already exists.
+        Per-row outcomes are INSERTED, ALREADY_EXISTED or FAILED.
+        """
+        return self._bulk_write_news_items(
+            news_items, ignore_duplicates=True, chunk_size=chunk_size
+        )
 
     # UPDATE METHODS
+    def upsert_news_items_bulk(
+        self, news_items: List[NewsItemSchema], chunk_size: int = None
+    ) -> DatabaseResponse:
+        """
+        Insert or update news items in chunks, resolving conflicts on data_URL.
+        Per-row outcomes are INSERTED, UPDATED or FAILED.
+        """
+        return self._bulk_write_news_items(
+            news_items, ignore_duplicates=False, chunk_size=chunk_size
+        )
+
     def update_news_item(self, id, news_item: NewsItemSchema) -> DatabaseResponse:
         """
         Update a news item in the database.
@@ -223,6 +454,62 @@ class SupabaseDBService:
             print(f"Error updating is_selected_for_download: {e}")
             return None
 
+    def update_news_item_display_fields(
+        self, id: int, news_item: NewsItemSchema
+    ) -> Optional[dict]:
+        """
+        Update only the precomputed display fields of a news item in the database.
+        """
+        try:
+            response: PostgrestAPIResponse = (
+                self.supabase_client.table(self.NEWS_ITEMS_TABLE)
+                .update(
+                    news_item.model_dump(
+                        include={
+                            "display_date_published",
+                            "display_summary",
+                            "is_article_text_available",
+                        }
+                    )
+                )
+                .eq("id", id)
+                .execute()
+            )
+            return response.data[0] if response.data else None
+        except Exception as e:
+            print(f"Error updating display fields: {e}")
+            return None
+
+    def update_news_item_enrichment_fields(
+        self, id: int, news_item: NewsItemSchema
+    ) -> Optional[dict]:
+        """
+        Update only the generated summary and category of a news item in the database,
+        along with the display fields derived from them, so edits made to the rest of
+        the row in the meantime are kept.
+        """
+        try:
+            response: PostgrestAPIResponse = (
+                self.supabase_client.table(self.NEWS_ITEMS_TABLE)
+                .update(
+                    news_item.model_dump(
+                        include={
+                            "generated_summary",
+                            "generated_category",
+                            "display_date_published",
+                            "display_summary",
+                            "is_article_text_available",
+                        }
+                    )
+                )
+                .eq("id", id)
+                .execute()
+            )
+            return response.data[0] if response.data else None
+        except Exception as e:
+            print(f"Error updating enrichment fields: {e}")
+            return None
+
     # DELETE METHODS
     def delete_news_item(self, id: int) -> Optional[dict]:
         """
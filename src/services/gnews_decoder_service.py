@@ -0,0 +1,127 @@
+import asyncio
+import time
+from urllib.parse import urlparse
+
+from ..utils import connect_sqlite, decode_gnews_url
+
+
+class GoogleNewsDecoderService:
+    """
+    Decodes Google News article URLs into publisher URLs without blocking the event loop.
+    Lookups run concurrently in worker threads with a bounded pool, and results are kept in a
+    local SQLite cache. Failed lookups are cached too, but expire after negative_ttl_seconds.
+    """
+
+    GOOGLE_NEWS_HOST = "news.google.com"
+
+    def __init__(
+        self,
+        cache_path: str = "gnews_decoder_cache.sqlite",
+        max_concurrency: int = 4,
+        negative_ttl_seconds: int = 24 * 60 * 60,
+        proxy: bool = True,
+    ):
+        self.cache_path = cache_path
+        self.max_concurrency = max_concurrency
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.proxy = proxy
+        self._create_cache_table()
+
+    def _create_cache_table(self):
+        with connect_sqlite(self.cache_path) as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS decoded_urls (
+                    source_url TEXT PRIMARY KEY,
+                    decoded_url TEXT,
+                    decoded_at REAL NOT NULL
+                )
+                """
+            )
+
+    @classmethod
+    def is_google_news_url(cls, url: str) -> bool:
+        try:
+            return urlparse(url).netloc.lower() == cls.GOOGLE_NEWS_HOST
+        except Exception:
+            return False
+
+    def _get_cached(self, urls: list[str]) -> dict[str, str | None]:
+        """
+        Return cached results for the given URLs. A None value is a cached failure.
+        Expired failures are treated as cache misses.
+        """
+        cached = {}
+        negative_cutoff = time.time() - self.negative_ttl_seconds
+        with connect_sqlite(self.cache_path) as connection:
+            for start in range(0, len(urls), 500):
+                chunk = urls[start : start + 500]
+                rows = connection.execute(
+                    f"SELECT source_url, decoded_url, decoded_at FROM decoded_urls "
+                    f"WHERE source_url IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for source_url, decoded_url, decoded_at in rows:
+                    if decoded_url is None and decoded_at < negative_cutoff:
+                        continue
+                    cached[source_url] = decoded_url
+        return cached
+
+    def _set_cached(self, results: dict[str, str | None]):
+        if not results:
+            return
+        now = time.time()
+        with connect_sqlite(self.cache_path) as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO decoded_urls (source_url, decoded_url, decoded_at) "
+                "VALUES (?, ?, ?)",
+                [
+                    (source_url, decoded_url, now)
+                    for source_url, decoded_url in results.items()
+                ],
+            )
+
+    def _decode_uncached(self, url: str) -> str | None:
+        """
+        Blocking decode of a single URL. Returns None if it could not be decoded.
+        """
+        decoded_url = decode_gnews_url(url, proxy=self.proxy)
+        if decoded_url and str(decoded_url) != str(url):
+            return decoded_url
+        return None
+
+    async def decode_many(self, urls: list[str]) -> dict[str, str]:
+        """
+        Decode many URLs concurrently. Returns a mapping of each URL to its decoded URL,
+        or to itself if it is not a Google News URL or could not be decoded.
+        """
+        decoded = {url: url for url in urls if url}
+        google_news_urls = [url for url in decoded if self.is_google_news_url(url)]
+        if not google_news_urls:
+            return decoded
+
+        cached = self._get_cached(google_news_urls)
+        misses = [url for url in google_news_urls if url not in cached]
+        print(
+            f"Google News URL decoding: {len(cached)} cached, {len(misses)} to decode."
+        )
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def decode_one(url: str) -> str | None:
+            async with semaphore:
+                return await asyncio.to_thread(self._decode_uncached, url)
+
+        fresh = dict(zip(misses, await asyncio.gather(*map(decode_one, misses))))
+        self._set_cached(fresh)
+
+        for url, decoded_url in {**cached, **fresh}.items():
+            if decoded_url:
+                decoded[url] = decoded_url
+        return decoded
+
+    async def decode(self, url: str) -> str:
+        """
+        Decode a single URL, returning the URL itself if it could not be decoded.
+        """
+        return (await self.decode_many([url])).get(url, url)
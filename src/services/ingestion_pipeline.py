@@ -0,0 +1,200 @@
+import asyncio
+import time
+from collections import defaultdict
+
+from ..models import NewsItemSchema
+from .news_item_service import NewsItemService
+from .job_service import report_job_progress
+
+# Stages news items flow through, in order
+INGESTION_STAGES = ["crawl", "decode", "scrape", "enrich"]
+
+
+class IngestionRunStats:
+    """
+    Counts and timing for a single pipeline run.
+    """
+
+    def __init__(self):
+        self.processed = {stage: 0 for stage in INGESTION_STAGES}
+        self.skipped = {stage: 0 for stage in INGESTION_STAGES}
+        self.failed = {stage: 0 for stage in INGESTION_STAGES}
+        self.errors: list[str] = []
+        self.started_at = time.monotonic()
+        self.finished_at: float | None = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def to_dict(self) -> dict:
+        return {
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 1),
+        }
+
+    def __str__(self) -> str:
+        return (
+            ", ".join(
+                f"{stage}: {self.processed[stage]} processed, "
+                f"{self.skipped[stage]} skipped, {self.failed[stage]} failed"
+                for stage in INGESTION_STAGES
+            )
+            + f" in {self.elapsed_seconds:.1f}s"
+        )
+
+
+class IngestionPipeline:
+    """
+    Runs crawling, URL decoding, scraping and LLM enrichment as one pipeline, so a
+    freshly crawled news item flows through every stage within the same run, rather
+    than waiting for separate full-table passes.
+
+    Each stage after the crawl is a pool of workers reading from a bounded queue;
+    a full queue makes the previous stage wait (backpressure). Scrapes also keep
+    the scrape scheduler's per-host limit.
+    """
+
+    def __init__(
+        self,
+        news_item_service: NewsItemService,
+        decode_workers: int = 4,
+        scrape_workers: int = 5,
+        enrich_workers: int = 8,
+        queue_size: int = 50,
+    ):
+        self.news_item_service = news_item_service
+        self.workers = {
+            "decode": decode_workers,
+            "scrape": scrape_workers,
+            "enrich": enrich_workers,
+        }
+        self.queue_size = queue_size
+
+    async def _decode(self, article: NewsItemSchema, stats: IngestionRunStats) -> bool:
+        # Non-canonical near-duplicates are neither decoded, scraped nor enriched
+        if article.duplicate_of_data_URL:
+            stats.skipped["decode"] += 1
+            return False
+
+        if article.data_source_type != "Google News RSS Feed" or article.extracted_URL:
+            stats.skipped["decode"] += 1
+        elif await self.news_item_service.decode_news_item_URL(article):
+            stats.processed["decode"] += 1
+        else:
+            stats.failed["decode"] += 1
+        return True
+
+    async def _scrape(
+        self,
+        article: NewsItemSchema,
+        stats: IngestionRunStats,
+        host_semaphores: dict[str, asyncio.Semaphore],
+    ) -> bool:
+        url = article.get_online_url()
+        host = self.news_item_service.scrape_scheduler.get_host(url)
+        async with host_semaphores[host]:
+            updated_id = await self.news_item_service.scrape_article(article)
+        if not updated_id or not article.has_article_text():
+            stats.failed["scrape"] += 1
+            return False
+        stats.processed["scrape"] += 1
+        return True
+
+    async def _enrich(self, article: NewsItemSchema, stats: IngestionRunStats) -> bool:
+        if await self.news_item_service.enrich_article(article):
+            stats.processed["enrich"] += 1
+        else:
+            stats.failed["enrich"] += 1
+        return True
+
+    async def _run_worker(
+        self,
+        stage: str,
+        process,
+        input_queue: asyncio.Queue,
+        output_queue: asyncio.Queue | None,
+        stats: IngestionRunStats,
+    ):
+        """
+        Process articles from the input queue until cancelled, passing those the
+        stage accepts on to the output queue.
+        """
+        while True:
+            article = await input_queue.get()
+            try:
+                if await process(article) and output_queue is not None:
+                    await output_queue.put(article)
+            except Exception as e:
+                stats.failed[stage] += 1
+                stats.errors.append(f"{stage} {article.id}: {e}")
+                print(f"Error in {stage} stage for article {article.id}: {e}")
+            finally:
+                input_queue.task_done()
+                report_job_progress(**stats.to_dict())
+
+    async def run(self) -> IngestionRunStats:
+        """
+        Crawl all sources and push every created news item through decoding,
+        scraping and enrichment. Returns the run statistics.
+        """
+        stats = IngestionRunStats()
+        queues = {
+            stage: asyncio.Queue(maxsize=self.queue_size)
+            for stage in ("decode", "scrape", "enrich")
+        }
+        host_semaphores = defaultdict(
+            lambda: asyncio.Semaphore(
+                self.news_item_service.scrape_scheduler.max_per_host
+            )
+        )
+        stage_processes = {
+            "decode": (lambda article: self._decode(article, stats), "scrape"),
+            "scrape": (
+                lambda article: self._scrape(article, stats, host_semaphores),
+                "enrich",
+            ),
+            "enrich": (lambda article: self._enrich(article, stats), None),
+        }
+        workers = [
+            asyncio.create_task(
+                self._run_worker(
+                    stage,
+                    process,
+                    queues[stage],
+                    queues[next_stage] if next_stage else None,
+                    stats,
+                )
+            )
+            for stage, (process, next_stage) in stage_processes.items()
+            for _ in range(self.workers[stage])
+        ]
+
+        async def enqueue_inserted_items(news_items: list[NewsItemSchema]):
+            stats.processed["crawl"] += len(news_items)
+            for news_item in news_items:
+                await queues["decode"].put(news_item)
+
+        try:
+            await self.news_item_service.crawl_all_sources(
+                decode_URLs=False, on_items_inserted=enqueue_inserted_items
+            )
+            # Each stage only hands items on before marking them done, so joining
+            # the queues in order waits for every item to leave the pipeline
+            for stage in ("decode", "scrape", "enrich"):
+                await queues[stage].join()
+        except Exception as e:
+            stats.errors.append(f"crawl: {e}")
+            print(f"Error running ingestion pipeline: {e}")
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self.news_item_service.crawl4ai_scraper.close()
+
+        stats.finished_at = time.monotonic()
+        print(f"Ingestion run finished: {stats}")
+        return stats
@@ -0,0 +1,164 @@
+import asyncio
+import contextvars
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional
+
+# Job run by the current thread/task, so long-running operations can report progress
+_current_job: contextvars.ContextVar[Optional["Job"]] = contextvars.ContextVar(
+    "current_job", default=None
+)
+
+
+def report_job_progress(**progress):
+    """
+    Update the progress of the job running the caller, if any (e.g. counts of
+    processed items). Does nothing outside of a job.
+    """
+    job = _current_job.get()
+    if job is not None:
+        job.update_progress(**progress)
+
+
+class JobStatusType(Enum):
+    """
+    Enum for background job status types.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class Job:
+    """
+    A background operation, with its status, progress and result.
+    """
+
+    def __init__(self, name: str):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.status = JobStatusType.QUEUED
+        self.progress: dict = {}
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        # Incremented on every change, so watchers can tell when to report again
+        self.version = 0
+
+    def update_progress(self, **progress):
+        self.progress = {**self.progress, **progress}
+        self.version += 1
+
+    def is_finished(self) -> bool:
+        return self.status in (JobStatusType.SUCCEEDED, JobStatusType.FAILED)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status.value,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class JobService:
+    """
+    Runs long operations (crawling, scraping, LLM enrichment) in a pool of worker
+    threads, each job in its own event loop, so web requests only enqueue them and
+    return a job ID to poll.
+
+    A job with the same name as a queued or running job is not enqueued again; the
+    existing job is returned instead. Only the most recent finished jobs are kept.
+    """
+
+    def __init__(self, max_workers: int = 1, max_finished_jobs: int = 100):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="job"
+        )
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _serialize_result(result: Any) -> Any:
+        return result.to_dict() if hasattr(result, "to_dict") else result
+
+    def _run(self, job: Job, operation: Callable[[], Awaitable[Any]]):
+        job.status = JobStatusType.RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        job.version += 1
+        token = _current_job.set(job)
+        started = time.monotonic()
+        try:
+            job.result = self._serialize_result(asyncio.run(operation()))
+            job.status = JobStatusType.SUCCEEDED
+        except Exception as e:
+            print(f"Job {job.name} ({job.id}) failed: {e}")
+            job.error = str(e)
+            job.status = JobStatusType.FAILED
+        finally:
+            _current_job.reset(token)
+            job.finished_at = datetime.now(timezone.utc)
+            job.update_progress(elapsed_seconds=round(time.monotonic() - started, 1))
+            self._prune_finished_jobs()
+
+    def _prune_finished_jobs(self):
+        with self._lock:
+            finished_jobs = [job for job in self._jobs.values() if job.is_finished()]
+            for job in finished_jobs[: -self.max_finished_jobs or None]:
+                del self._jobs[job.id]
+
+    def _get_active_job(self, name: str) -> Optional[Job]:
+        for job in self._jobs.values():
+            if job.name == name and not job.is_finished():
+                return job
+        return None
+
+    def get_active_job(self, name: str) -> Optional[Job]:
+        """
+        Return the queued or running job with the given name, if any.
+        """
+        with self._lock:
+            return self._get_active_job(name)
+
+    def submit(self, name: str, operation: Callable[[], Awaitable[Any]]) -> Job:
+        """
+        Enqueue a coroutine function to run as a job, and return the job.
+        """
+        with self._lock:
+            job = self._get_active_job(name)
+            if job is not None:
+                return job
+            job = Job(name)
+            self._jobs[job.id] = job
+        self.executor.submit(self._run, job, operation)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list[Job]:
+        """
+        Return the known jobs, most recent first.
+        """
+        with self._lock:
+            return sorted(
+                self._jobs.values(), key=lambda job: job.created_at, reverse=True
+            )
+
+    def shutdown(self, wait: bool = True):
+        self.executor.shutdown(wait=wait)
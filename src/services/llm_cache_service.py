@@ -0,0 +1,128 @@
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from typing import Any, Optional
+
+from ..utils import connect_sqlite
+
+
+class LLMCacheService:
+    """
+    Persistent cache of LLM results, stored in a local SQLite file.
+    Entries are keyed by a hash of the normalized input text, model, prompt version and
+    parameters, so identical prompts (e.g. syndicated stories) are only paid for once.
+    When the stored results exceed max_size_bytes, the least recently used are evicted.
+    """
+
+    def __init__(
+        self,
+        cache_path: str = "llm_cache.sqlite",
+        max_size_bytes: int = 50 * 1024 * 1024,
+    ):
+        self.cache_path = cache_path
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._create_cache_table()
+
+    def _create_cache_table(self):
+        with connect_sqlite(self.cache_path) as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_results (
+                    cache_key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    last_accessed_at REAL NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS llm_results_last_accessed_at "
+                "ON llm_results (last_accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(text: str, model: str, prompt_version: str, params: dict = None) -> str:
+        """
+        Hash the normalized input text, model, prompt version and parameters.
+        """
+        normalized_text = re.sub(r"\s+", " ", text or "").strip()
+        key_data = json.dumps(
+            [normalized_text, model, prompt_version, params or {}], sort_keys=True
+        )
+        return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[Any]:
+        """
+        Return the cached result, or None on a miss.
+        """
+        try:
+            with connect_sqlite(self.cache_path) as connection:
+                row = connection.execute(
+                    "SELECT result FROM llm_results WHERE cache_key = ?", (cache_key,)
+                ).fetchone()
+                if row:
+                    connection.execute(
+                        "UPDATE llm_results SET last_accessed_at = ? WHERE cache_key = ?",
+                        (time.time(), cache_key),
+                    )
+        except Exception as e:
+            print(f"Error reading LLM cache: {e}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, cache_key: str, result: Any):
+        """
+        Store a result, evicting the least recently used results if over the size limit.
+        """
+        serialized_result = json.dumps(result)
+        size_bytes = len(serialized_result.encode("utf-8"))
+        try:
+            with connect_sqlite(self.cache_path) as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO llm_results (cache_key, result, size_bytes, last_accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (cache_key, serialized_result, size_bytes, time.time()),
+                )
+                self._evict(connection)
+        except Exception as e:
+            print(f"Error writing LLM cache: {e}")
+
+    def _evict(self, connection: sqlite3.Connection):
+        total_size_bytes = connection.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM llm_results"
+        ).fetchone()[0]
+        if total_size_bytes <= self.max_size_bytes:
+            return
+
+        # Evict down to 90% of the limit, so eviction doesn't run on every write
+        bytes_to_free = total_size_bytes - int(self.max_size_bytes * 0.9)
+        rows = connection.execute(
+            "SELECT cache_key, size_bytes FROM llm_results ORDER BY last_accessed_at"
+        )
+        evicted_keys = []
+        for cache_key, size_bytes in rows:
+            if bytes_to_free <= 0:
+                break
+            evicted_keys.append((cache_key,))
+            bytes_to_free -= size_bytes
+        connection.executemany(
+            "DELETE FROM llm_results WHERE cache_key = ?", evicted_keys
+        )
+        print(f"Evicted {len(evicted_keys)} results from the LLM cache.")
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
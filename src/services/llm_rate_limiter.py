@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket holding up to capacity tokens, refilled continuously over a minute.
+    """
+
+    def __init__(self, capacity_per_minute: float):
+        self.capacity = float(capacity_per_minute)
+        self.refill_rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate
+        )
+        self.last_refill = now
+
+    def seconds_until_available(self, amount: float) -> float:
+        self._refill()
+        # A request larger than the bucket waits for a full bucket instead of forever
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+
+    def consume(self, amount: float):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float):
+        """
+        Return tokens to the bucket, or take more if amount is negative.
+        """
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class LLMRateLimiter:
+    """
+    Limits LLM calls to a number of requests per minute and tokens per minute,
+    so throughput stays at the provider's limits instead of bursting into rate limit errors.
+    """
+
+    def __init__(self, requests_per_minute: int = 500, tokens_per_minute: int = 30000):
+        self.requests_bucket = TokenBucket(requests_per_minute)
+        self.tokens_bucket = TokenBucket(tokens_per_minute)
+
+    async def acquire(self, estimated_tokens: int):
+        """
+        Wait until a request using estimated_tokens can be sent, then reserve it.
+        """
+        while True:
+            wait_seconds = max(
+                self.requests_bucket.seconds_until_available(1),
+                self.tokens_bucket.seconds_until_available(estimated_tokens),
+            )
+            if wait_seconds <= 0:
+                # No await between checking and consuming, so this is atomic in the event loop
+                self.requests_bucket.consume(1)
+                self.tokens_bucket.consume(estimated_tokens)
+                return
+            await asyncio.sleep(wait_seconds)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Correct the tokens bucket once the actual usage of a request is known.
+        """
+        self.tokens_bucket.refund(estimated_tokens - actual_tokens)
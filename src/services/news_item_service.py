@@ -1,43 +1,138 @@
 import asyncio
+import calendar
 import csv
-from ..models import NewsItemSchema, ValidationError
-from ..utils import decode_gnews_url
+import os
+import tempfile
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+from ..models import (
+    NEWS_ITEM_LIST_COLUMNS,
+    CrawlSourceStateSchema,
+    NewsItemListSchema,
+    NewsItemSchema,
+    ValidationError,
+)
 
-from .crawlers.rss_feed_crawl import RSS_FEEDS, extract_articles_from_feed
+from .crawlers.rss_feed_crawl import RSS_FEEDS, extract_feed
+from .crawlers.http_session import HTTPSessionManager
 from .crawlers.google_news_crawl import (
     CANADIAN_LOCATIONS,
     GOOGLE_NEWS_SEARCH_QUERIES,
     search_news,
 )
-from .database_service import SupabaseDBService
+from .database_service import BulkWriteOutcomeType, SupabaseDBService
+from .crawl_state_service import CrawlStateService
+from .content_store_service import ContentStoreService
+from .gnews_decoder_service import GoogleNewsDecoderService
 from .scrapers.crawl4ai_scraper import Crawl4AIScraper
-from .openai_service import OpenAIService
+from .scrapers.scrape_scheduler import ScrapeScheduler
+from .openai_service import OpenAIService, UNCATEGORIZED, categories
+from ..utils import NearDuplicateIndex, get_text_cleaning_version, normalize_url
+from .category_classifier_service import CategoryClassifierService
+from .job_service import report_job_progress
+
+# Scraped articles: bodies are in the content store, or still inline in
+# crawl4ai_result for rows not yet migrated (see migrate_inline_content_to_store)
+SCRAPED_CONTENT_FILTER = "content_hash.not.is.null,crawl4ai_result.not.is.null"
+
+# Columns the display fields are computed from, leaving out any article body
+DISPLAY_BACKFILL_COLUMNS = ",".join(
+    [
+        "id",
+        "data_URL",
+        "data_json",
+        "extracted_date_published",
+        "extracted_summary",
+        "generated_summary",
+        "content_hash",
+        "crawl4ai_metadata:crawl4ai_result->metadata",
+    ]
+)
+
+# Types of crawled sources, also the prefixes of their crawl state keys
+CRAWL_SOURCE_TYPES = ["rss", "google_news"]
 
 
 class NewsItemService:
+    # Maximum number of requests in one OpenAI Batch API input file
+    BATCH_MAX_REQUESTS = 50000
+
     def __init__(
         self,
         database_service: SupabaseDBService,
         crawl4ai_scraper: Crawl4AIScraper,
         openai_service: OpenAIService,
+        scrape_scheduler: ScrapeScheduler = None,
+        gnews_decoder_service: GoogleNewsDecoderService = None,
+        content_store_service: ContentStoreService = None,
+        category_classifier_service: CategoryClassifierService = None,
+        near_duplicate_index: NearDuplicateIndex = None,
+        near_duplicate_seed_limit: int = 2000,
+        crawl_state_service: CrawlStateService = None,
+        crawl_overlap_hours: int = 24,
+        http_session_manager: HTTPSessionManager = None,
+        google_news_max_concurrency: int = 8,
+        crawl_queue_size: int = 100,
+        crawl_batch_size: int = 20,
     ):
         self.database_service = database_service
         self.crawl4ai_scraper = crawl4ai_scraper
         self.openai_service = openai_service
+        self.scrape_scheduler = scrape_scheduler or ScrapeScheduler()
+        self.gnews_decoder_service = (
+            gnews_decoder_service or GoogleNewsDecoderService()
+        )
+        self.content_store_service = content_store_service or ContentStoreService(
+            database_service
+        )
+        self.category_classifier_service = category_classifier_service
+        self.near_duplicate_index = near_duplicate_index or NearDuplicateIndex()
+        self.near_duplicate_seed_limit = near_duplicate_seed_limit
+        self._is_near_duplicate_index_seeded = False
+        self.crawl_state_service = crawl_state_service or CrawlStateService(
+            database_service
+        )
+        self.crawl_overlap = timedelta(hours=crawl_overlap_hours)
+        self.http_session_manager = http_session_manager or HTTPSessionManager()
+        self.google_news_max_concurrency = google_news_max_concurrency
+        self.crawl_queue_size = crawl_queue_size
+        self.crawl_batch_size = crawl_batch_size
+
+    def _fetch_existing_data_URLs(self, entries: list[dict]) -> set[str]:
+        """
+        Return the data_URLs of crawled entries that already exist in the database.
+        Existence is resolved with a few batched queries rather than one query per entry.
+        """
+        candidate_data_URLs = [entry.get("link") for entry in entries]
+        try:
+            existing_data_URLs = self.database_service.fetch_existing_data_URLs(
+                candidate_data_URLs
+            )
+        except Exception as e:
+            # Inserts are still protected by the unique data_URL constraint
+            print(f"Error checking existing articles, processing all entries: {e}")
+            return set()
+
+        print(
+            f"{sum(url in existing_data_URLs for url in candidate_data_URLs)} of {len(entries)} crawled entries already exist in the database."
+        )
+        return existing_data_URLs
 
-    def _process_article(
+    def _build_news_item(
         self,
         data_source_type,
         data_json: dict,
         data_URL,
+        decoded_URLs: dict[str, str] = None,
         **additional_params,
-    ) -> int | None:
+    ) -> NewsItemSchema | None:
         """
-        Process a single article and return the ID of the created NewsItemSchema.
-        This function creates a NewsItemSchema object, checks if it already exists in the database,
-        and if not, inserts it into the database. It also handles the extraction of relevant fields
-        from the article data.
-        If the article already exists in the database, it returns None.
+        Build a NewsItemSchema for a single crawled article, handling the extraction of
+        relevant fields from the article data.
+        decoded_URLs maps crawled URLs to publisher URLs (see GoogleNewsDecoderService).
+        Callers are expected to have filtered out articles that already exist in the database
+        (see _fetch_existing_data_URLs).
         """
         try:
             crawled_news_item = NewsItemSchema(
@@ -45,139 +140,687 @@ class NewsItemService:
                 data_json=data_json,
                 data_URL=data_URL,
             )
-            fetched_news_item_response = (
-                self.database_service.fetch_news_items_by_data_URL(
-                    crawled_news_item.data_URL
-                )
-            )
-            if not fetched_news_item_response.data:
-                extracted_URL = decode_gnews_url(crawled_news_item.data_URL)
-                if str(extracted_URL) != str(crawled_news_item.data_URL):
-                    crawled_news_item.extracted_URL = extracted_URL
-
-                crawled_news_item.extracted_date_published = data_json.get("published")
-                crawled_news_item.extracted_title = data_json.get("title")
-                crawled_news_item.extracted_news_source = additional_params.get(
-                    "source"
-                ) or data_json.get("source").get("title")
-                crawled_news_item.extracted_author = data_json.get("author") or None
-                crawled_news_item.extracted_summary = data_json.get("summary")
-                insert_response = self.database_service.insert_news_item(
-                    crawled_news_item
-                )
-                if insert_response.is_success():
-                    print(
-                        f"Database Insert Success: Created with ID {insert_response.data.id}"
-                    )
-                    return int(insert_response.data.id)
-                else:
-                    print(f"Database Insert Failed: {insert_response.message}")
-            else:
-                print(
-                    f"Article already exists in the database with ID {fetched_news_item_response.data[0]['id']}"
-                )
+            extracted_URL = (decoded_URLs or {}).get(crawled_news_item.data_URL)
+            if extracted_URL and str(extracted_URL) != str(crawled_news_item.data_URL):
+                crawled_news_item.extracted_URL = extracted_URL
+
+            crawled_news_item.extracted_date_published = data_json.get("published")
+            crawled_news_item.extracted_title = data_json.get("title")
+            crawled_news_item.extracted_news_source = additional_params.get(
+                "source"
+            ) or data_json.get("source").get("title")
+            crawled_news_item.extracted_author = data_json.get("author") or None
+            crawled_news_item.extracted_summary = data_json.get("summary")
+            crawled_news_item.refresh_display_fields()
+            return crawled_news_item
         except Exception as e:
             print(f"Error processing article: {e}")
         return None
 
-    async def _crawl_rss_feeds(self) -> list[int]:
+    @staticmethod
+    def _get_near_duplicate_text(news_item: NewsItemSchema) -> str:
         """
-        Crawl articles from RSS feeds and return ID of NewsItemSchema.
+        Text that near-duplicate stories share: the title without the outlet suffix
+        Google News adds, and the summary unless it only repeats the title and outlet.
         """
-        tasks = [
-            extract_articles_from_feed(feed_url) for feed_url in RSS_FEEDS.values()
+        title = news_item.get_title() or ""
+        news_source = news_item.get_news_source()
+        if news_source and title.endswith(f" - {news_source}"):
+            title = title[: -len(f" - {news_source}")]
+
+        summary = news_item.get_article_summary() or ""
+        for repeated_text in (title, news_source):
+            if repeated_text:
+                summary = summary.replace(repeated_text, "")
+        if len(summary.split()) < 10:
+            summary = ""
+        return f"{title} {summary}".strip()
+
+    def _seed_near_duplicate_index(self):
+        """
+        Index the most recent canonical news items, once, so new items are
+        clustered with stories crawled in previous runs.
+        """
+        if self._is_near_duplicate_index_seeded:
+            return
+        try:
+            db_query = self.database_service.query_select_news_items_from_db(
+                filters={"duplicate_of_data_URL": "null"},
+                sort={"id": "desc"},
+                columns=NEWS_ITEM_LIST_COLUMNS,
+            ).limit(self.near_duplicate_seed_limit)
+            db_query_response = db_query.execute()
+        except Exception as e:
+            print(f"Error seeding the near-duplicate index: {e}")
+            return
+
+        for item in db_query_response.data or []:
+            news_item = NewsItemListSchema(**item)
+            self.near_duplicate_index.add(
+                news_item.data_URL, self._get_near_duplicate_text(news_item)
+            )
+        self._is_near_duplicate_index_seeded = True
+        print(f"Seeded near-duplicate index with {len(self.near_duplicate_index)} items")
+
+    def _mark_near_duplicates(
+        self, news_items: list[NewsItemSchema]
+    ) -> dict[str, str]:
+        """
+        Cluster news items with near-duplicate stories (e.g. the same story found by
+        several Google News queries, or syndicated by several outlets). The first item
+        of a cluster is canonical; the others reference it in duplicate_of_data_URL,
+        and are skipped by scraping, summarization and categorization.
+        Returns the near-duplicate text of each canonical item by data_URL, to index
+        once it is saved.
+        """
+        self._seed_near_duplicate_index()
+
+        # Canonical items of this batch are only indexed for the batch until saved
+        batch_index = self.near_duplicate_index.empty_like()
+        canonical_texts = {}
+        for news_item in news_items:
+            text = self._get_near_duplicate_text(news_item)
+            canonical_data_URL = self.near_duplicate_index.find_duplicate(
+                text
+            ) or batch_index.find_duplicate(text)
+            if canonical_data_URL and canonical_data_URL != news_item.data_URL:
+                news_item.duplicate_of_data_URL = canonical_data_URL
+            else:
+                batch_index.add(news_item.data_URL, text)
+                canonical_texts[news_item.data_URL] = text
+        print(
+            f"Marked {len(news_items) - len(canonical_texts)} of {len(news_items)} "
+            f"items as near-duplicates"
+        )
+        return canonical_texts
+
+    def _insert_news_items_bulk(
+        self, news_items: list[NewsItemSchema]
+    ) -> tuple[list[NewsItemSchema], set[str]]:
+        """
+        Insert news items in bulk. Returns the created news items (with their IDs), and
+        the data_URLs of the items saved (created or already existing).
+        """
+        if not news_items:
+            return [], set()
+
+        insert_response = self.database_service.insert_news_items_bulk(news_items)
+        if insert_response.message:
+            print(f"Database Insert Failed: {insert_response.message}")
+        if not insert_response.data:
+            return [], set()
+
+        inserted_news_items = insert_response.data["news_items"]
+        outcomes = insert_response.data["outcomes"]
+        outcome_counts = Counter(outcome.value for outcome in outcomes.values())
+        print(
+            f"Database Insert: {dict(outcome_counts)}, created with IDs "
+            f"{[int(news_item.id) for news_item in inserted_news_items]}"
+        )
+        saved_data_URLs = {
+            data_URL
+            for data_URL, outcome in outcomes.items()
+            if outcome != BulkWriteOutcomeType.FAILED
+        }
+        return inserted_news_items, saved_data_URLs
+
+    def _insert_news_items(
+        self, news_items: list[NewsItemSchema]
+    ) -> tuple[list[NewsItemSchema], bool]:
+        """
+        Insert crawled news items in bulk, canonical items first, so near-duplicates
+        only reference saved items and only saved items are indexed.
+        Returns the created news items (with their IDs), and whether every item was
+        saved (created or already existing), so crawl state is only advanced past saved items.
+        """
+        if not news_items:
+            return [], True
+
+        canonical_texts = self._mark_near_duplicates(news_items)
+        inserted_news_items, saved_data_URLs = self._insert_news_items_bulk(
+            [news_item for news_item in news_items if not news_item.duplicate_of_data_URL]
+        )
+        for data_URL in saved_data_URLs:
+            self.near_duplicate_index.add(data_URL, canonical_texts[data_URL])
+
+        # Duplicates of items that failed to save are left for the next crawl
+        unsaved_data_URLs = canonical_texts.keys() - saved_data_URLs
+        duplicate_news_items = [
+            news_item
+            for news_item in news_items
+            if news_item.duplicate_of_data_URL
+            and news_item.duplicate_of_data_URL not in unsaved_data_URLs
         ]
-        results = await asyncio.gather(*tasks)
+        inserted_duplicates, saved_duplicate_data_URLs = self._insert_news_items_bulk(
+            duplicate_news_items
+        )
+        saved_data_URLs |= saved_duplicate_data_URLs
+        return (
+            inserted_news_items + inserted_duplicates,
+            all(news_item.data_URL in saved_data_URLs for news_item in news_items),
+        )
 
-        news_items_ids = []
-        for source, articles in zip(RSS_FEEDS.keys(), results):
-            for entry in articles:
-                try:
-                    data_URL = entry.get("link")
-                    news_item_id = self._process_article(
-                        data_source_type="Specific RSS Feed",
-                        data_json=entry,
-                        data_URL=data_URL,
-                        source=source,
-                    )
-                    if news_item_id:
-                        news_items_ids.append(news_item_id)
-                except Exception as e:
-                    print(f"Error for RSS feed entry: {e}")
-        return news_items_ids
+    @staticmethod
+    def _get_entry_published_at(entry: dict) -> datetime | None:
+        """
+        Publication time of a feed entry, in UTC, if the feed gives one.
+        """
+        published_parsed = entry.get("published_parsed") or entry.get(
+            "updated_parsed"
+        )
+        if not published_parsed:
+            return None
+        return datetime.fromtimestamp(calendar.timegm(published_parsed), timezone.utc)
 
-    async def _crawl_google_news(self) -> list[int]:
+    async def _fetch_rss_source(
+        self, source: str, feed_url: str, state: CrawlSourceStateSchema
+    ) -> dict:
         """
-        Crawl articles from Google News, create NewsItemSchema objects and return list of IDs.
+        Fetch one RSS feed, conditionally (ETag / Last-Modified), skipping entries
+        published before the latest entry seen in the previous crawl (minus an overlap).
+        Returns a crawl result: the entries, and the updated state if the fetch succeeded.
         """
-        tasks = [
-            asyncio.get_event_loop().run_in_executor(None, search_news, query, location)
+        parsed_feed = await extract_feed(
+            feed_url,
+            etag=state.etag,
+            last_modified=state.last_modified,
+            session_manager=self.http_session_manager,
+        )
+        result = {
+            "data_source_type": "Specific RSS Feed",
+            "source": source,
+            "search_query": None,
+            "entries": [],
+            "state": None,
+        }
+        if not parsed_feed or parsed_feed.get("status", 200) >= 400:
+            return result
+
+        last_seen_published_at = (
+            datetime.fromisoformat(state.last_seen_published_at)
+            if state.last_seen_published_at
+            else None
+        )
+        for entry in parsed_feed.entries:
+            published_at = self._get_entry_published_at(entry)
+            if (
+                published_at
+                and last_seen_published_at
+                and published_at < last_seen_published_at - self.crawl_overlap
+            ):
+                continue
+            result["entries"].append(entry)
+            if published_at and (
+                not last_seen_published_at or published_at > last_seen_published_at
+            ):
+                last_seen_published_at = published_at
+        print(
+            f"{source}: {len(result['entries'])} new or recent of "
+            f"{len(parsed_feed.entries)} entries (status {parsed_feed.get('status')})"
+        )
+
+        state.etag = parsed_feed.get("etag")
+        state.last_modified = parsed_feed.get("modified")
+        if last_seen_published_at:
+            state.last_seen_published_at = last_seen_published_at.isoformat()
+        state.last_successful_run_at = datetime.now(timezone.utc).isoformat()
+        result["state"] = state
+        return result
+
+    async def _fetch_google_news_source(
+        self,
+        query: str,
+        location: str,
+        state: CrawlSourceStateSchema,
+        semaphore: asyncio.Semaphore,
+    ) -> dict:
+        """
+        Run one Google News search, covering the days since its last successful run
+        plus an overlap (or the default window on the first run).
+        Returns a crawl result: the entries, and the updated state.
+        """
+        now = datetime.now(timezone.utc)
+        from_date = (
+            (
+                datetime.fromisoformat(state.last_successful_run_at)
+                - self.crawl_overlap
+            ).strftime("%Y-%m-%d")
+            if state.last_successful_run_at
+            else None
+        )
+        to_date = (now + timedelta(days=1)).strftime("%Y-%m-%d") if from_date else None
+        entries = await search_news(
+            await self.http_session_manager.get_session(),
+            query,
+            location,
+            from_date,
+            to_date,
+            semaphore=semaphore,
+            max_bytes=self.http_session_manager.max_response_bytes,
+        )
+        if entries is not None:
+            state.last_successful_run_at = now.isoformat()
+        return {
+            "data_source_type": "Google News RSS Feed",
+            "source": None,
+            "search_query": f"{query} in {location}",
+            "entries": entries or [],
+            "state": state if entries is not None else None,
+        }
+
+    @staticmethod
+    def _select_due_sources(
+        states: dict[str, CrawlSourceStateSchema],
+        source_interval: timedelta = None,
+        max_sources: int = None,
+    ) -> list[str]:
+        """
+        Return the keys of the sources due for crawling: those without a successful
+        crawl within source_interval (all of them if None), least recently crawled
+        first, and at most max_sources of them.
+        """
+        now = datetime.now(timezone.utc)
+        last_runs = {
+            source_key: (
+                datetime.fromisoformat(state.last_successful_run_at)
+                if state.last_successful_run_at
+                else None
+            )
+            for source_key, state in states.items()
+        }
+        due_keys = [
+            source_key
+            for source_key, last_run in last_runs.items()
+            if source_interval is None
+            or last_run is None
+            or now - last_run >= source_interval
+        ]
+        if max_sources is not None:
+            never_run = datetime.min.replace(tzinfo=timezone.utc)
+            due_keys.sort(key=lambda source_key: last_runs[source_key] or never_run)
+            due_keys = due_keys[:max_sources]
+        return due_keys
+
+    def _get_rss_source_tasks(
+        self, source_interval: timedelta = None, max_sources: int = None
+    ) -> list[asyncio.Task]:
+        source_keys = {
+            source: f"rss:{feed_url}" for source, feed_url in RSS_FEEDS.items()
+        }
+        states = self.crawl_state_service.get_states(list(source_keys.values()))
+        due_keys = set(self._select_due_sources(states, source_interval, max_sources))
+        return [
+            asyncio.create_task(
+                self._fetch_rss_source(source, feed_url, states[source_keys[source]])
+            )
+            for source, feed_url in RSS_FEEDS.items()
+            if source_keys[source] in due_keys
+        ]
+
+    def _get_google_news_source_tasks(
+        self, source_interval: timedelta = None, max_sources: int = None
+    ) -> list[asyncio.Task]:
+        search_queries = [
+            (query, location)
             for query in GOOGLE_NEWS_SEARCH_QUERIES
             for location in CANADIAN_LOCATIONS
         ]
-        results = await asyncio.gather(*tasks)
+        source_keys = [
+            f"google_news:{query} in {location}" for query, location in search_queries
+        ]
+        states = self.crawl_state_service.get_states(source_keys)
+        due_keys = set(self._select_due_sources(states, source_interval, max_sources))
+        semaphore = asyncio.Semaphore(self.google_news_max_concurrency)
+        return [
+            asyncio.create_task(
+                self._fetch_google_news_source(
+                    query, location, states[source_key], semaphore
+                )
+            )
+            for (query, location), source_key in zip(search_queries, source_keys)
+            if source_key in due_keys
+        ]
 
-        news_items_ids = []
-        for (query, location), articles in zip(
-            [(q, l) for q in GOOGLE_NEWS_SEARCH_QUERIES for l in CANADIAN_LOCATIONS],
-            results,
-        ):
-            for entry in articles:
-                try:
-                    data_URL = entry.get("link")
-                    news_item_id = self._process_article(
-                        data_source_type="Google News RSS Feed",
-                        data_json=entry,
-                        data_URL=data_URL,
+    @staticmethod
+    def _dedupe_crawl_results(
+        results: list[dict], link_by_key: dict[tuple, str]
+    ) -> tuple[list[tuple[dict, dict]], dict[str, list[str]]]:
+        """
+        Drop entries already returned in this run (e.g. by several search queries),
+        keyed on their normalized link and on their entry ID. link_by_key holds the
+        keys seen so far in the run, and is updated.
+        Returns the unique (result, entry) pairs, and the search queries that
+        surfaced each of them by link.
+        """
+        unique_entries = []
+        search_queries_by_link = {}
+        entry_count = 0
+        for result in results:
+            for entry in result["entries"]:
+                entry_count += 1
+                keys = [
+                    key
+                    for key in (
+                        ("link", normalize_url(entry.get("link"))),
+                        ("id", entry.get("id")),
                     )
-                    if news_item_id:
-                        news_items_ids.append(news_item_id)
-                except Exception as e:
-                    print(f"Error for Google News entry: {e}")
-        return news_items_ids
+                    if key[1]
+                ]
+                link = next(
+                    (link_by_key[key] for key in keys if key in link_by_key), None
+                )
+                if link is None:
+                    link = entry.get("link")
+                    unique_entries.append((result, entry))
+                    search_queries_by_link[link] = []
+                for key in keys:
+                    link_by_key.setdefault(key, link)
+                # Repeats of entries processed in an earlier batch are only dropped
+                if result["search_query"] and link in search_queries_by_link:
+                    if result["search_query"] not in search_queries_by_link[link]:
+                        search_queries_by_link[link].append(result["search_query"])
+
+        print(f"{len(unique_entries)} unique of {entry_count} crawled entries")
+        return unique_entries, search_queries_by_link
 
-    async def crawl_all_sources(self) -> list[int]:
+    async def _process_crawl_results(
+        self,
+        results: list[dict],
+        link_by_key: dict[tuple, str],
+        decode_URLs: bool = True,
+        on_items_inserted: Callable[[list[NewsItemSchema]], Awaitable[Any]] = None,
+    ) -> list[int]:
+        """
+        De-duplicate, check against the database, decode (unless decode_URLs is False),
+        build and insert the entries of a batch of crawl results, then save the crawl
+        state of their sources if every item was saved.
+        on_items_inserted is awaited with the created news items.
+        Returns the IDs of the created rows.
+        """
+        unique_entries, search_queries_by_link = self._dedupe_crawl_results(
+            results, link_by_key
+        )
+        existing_data_URLs = self._fetch_existing_data_URLs(
+            [entry for _, entry in unique_entries]
+        )
+        new_entries = [
+            (result, entry)
+            for result, entry in unique_entries
+            if entry.get("link") not in existing_data_URLs
+        ]
+        decoded_URLs = (
+            await self.gnews_decoder_service.decode_many(
+                [entry.get("link") for _, entry in new_entries]
+            )
+            if decode_URLs
+            else {}
+        )
+
+        news_items = []
+        for result, entry in new_entries:
+            additional_params = {"source": result["source"]} if result["source"] else {}
+            news_item = self._build_news_item(
+                data_source_type=result["data_source_type"],
+                data_json=entry,
+                data_URL=entry.get("link"),
+                decoded_URLs=decoded_URLs,
+                **additional_params,
+            )
+            if news_item:
+                news_item.crawl_search_queries = (
+                    search_queries_by_link.get(entry.get("link")) or None
+                )
+                news_items.append(news_item)
+
+        inserted_news_items, is_saved = self._insert_news_items(news_items)
+        if is_saved:
+            self.crawl_state_service.save_states(
+                [result["state"] for result in results if result["state"]]
+            )
+        if on_items_inserted and inserted_news_items:
+            await on_items_inserted(inserted_news_items)
+        return [int(news_item.id) for news_item in inserted_news_items]
+
+    async def _run_crawl_pipeline(
+        self,
+        source_tasks: list[asyncio.Task],
+        decode_URLs: bool = True,
+        on_items_inserted: Callable[[list[NewsItemSchema]], Awaitable[Any]] = None,
+    ) -> list[int]:
         """
-        Crawl all sources (RSS feeds and Google News) and return list of IDs.
+        Stream crawl results into processing as each source completes, instead of
+        waiting for every source. Results go through a bounded queue; results that
+        arrive while a batch is being processed are processed together in the next
+        batch, so they share database lookups and URL decoding.
+        See _process_crawl_results for decode_URLs and on_items_inserted.
         """
-        rss_feed_ids = await self._crawl_rss_feeds()
-        google_news_ids = await self._crawl_google_news()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.crawl_queue_size)
+
+        async def produce_results():
+            try:
+                for next_result in asyncio.as_completed(source_tasks):
+                    try:
+                        await queue.put(await next_result)
+                    except Exception as e:
+                        print(f"Error crawling source: {e}")
+            finally:
+                await queue.put(None)
+
+        async def consume_results() -> list[int]:
+            inserted_ids = []
+            link_by_key = {}
+            crawled_source_count = 0
+            is_done = False
+            while not is_done:
+                batch = []
+                result = await queue.get()
+                while result is not None:
+                    batch.append(result)
+                    if queue.empty() or len(batch) >= self.crawl_batch_size:
+                        break
+                    result = queue.get_nowait()
+                is_done = result is None
+                if batch:
+                    inserted_ids += await self._process_crawl_results(
+                        batch, link_by_key, decode_URLs, on_items_inserted
+                    )
+                    crawled_source_count += len(batch)
+                    report_job_progress(
+                        crawled_sources=crawled_source_count,
+                        source_total=len(source_tasks),
+                        inserted=len(inserted_ids),
+                    )
+            return inserted_ids
+
+        producer = asyncio.create_task(produce_results())
+        try:
+            inserted_ids = await consume_results()
+        finally:
+            producer.cancel()
+            for task in source_tasks:
+                task.cancel()
+        return inserted_ids
+
+    async def crawl_all_sources(
+        self,
+        decode_URLs: bool = True,
+        on_items_inserted: Callable[[list[NewsItemSchema]], Awaitable[Any]] = None,
+        source_types: list[str] = None,
+        source_interval: timedelta = None,
+        max_sources: int = None,
+    ) -> list[int]:
+        """
+        Crawl all sources (RSS feeds and Google News) concurrently and return list of IDs.
+        Entries are processed as each source returns, so the crawl takes about as
+        long as its slowest source. The shared HTTP session is closed afterwards.
+        With decode_URLs False, Google News URLs are left for the caller to decode
+        (see decode_news_item_URL). on_items_inserted is awaited with each batch of
+        created news items.
+
+        source_types limits the crawl to some of CRAWL_SOURCE_TYPES. For small
+        incremental crawls, source_interval skips sources crawled successfully within
+        that time, and max_sources caps the sources crawled per type (least recently
+        crawled first).
+        """
+        source_types = source_types or CRAWL_SOURCE_TYPES
+        # Rebuild the near-duplicate index each crawl, so it stays bounded in a
+        # long-running process
+        self.near_duplicate_index.clear()
+        self._is_near_duplicate_index_seeded = False
+        try:
+            source_tasks = []
+            if "rss" in source_types:
+                source_tasks += self._get_rss_source_tasks(source_interval, max_sources)
+            if "google_news" in source_types:
+                source_tasks += self._get_google_news_source_tasks(
+                    source_interval, max_sources
+                )
+            all_ids = await self._run_crawl_pipeline(
+                source_tasks,
+                decode_URLs=decode_URLs,
+                on_items_inserted=on_items_inserted,
+            )
+        finally:
+            await self.http_session_manager.close()
 
-        all_ids = rss_feed_ids + google_news_ids
         print(
-            f"Crawled and added {len(all_ids)} articles from all sources into the database."
+            f"Crawled {len(source_tasks)} sources ({', '.join(source_types)}) and added "
+            f"{len(all_ids)} articles into the database."
         )
         return all_ids
 
-    async def _update_article_with_scraped_data(
-        self, article: NewsItemSchema
-    ) -> int | None:
+    def _save_scraped_data(self, article: NewsItemSchema, result: dict) -> int | None:
+        """
+        Store scraped data in the content store, reference it from the article,
+        and update the article in the database.
+        """
+        # Store the normalized text with the content, so it is only computed once
+        content = {
+            **result,
+            "article_text": NewsItemSchema.compute_article_text(result),
+            "article_text_version": get_text_cleaning_version(),
+        }
+        content_hash = self.content_store_service.put(content)
+        if not content_hash:
+            return None
+        article.set_scraped_content(content, content_hash)
+        article.refresh_display_fields()
+        update_response = self.database_service.update_news_item(article.id, article)
+        if update_response.is_success():
+            print(f"Database Update Success: ID {update_response.data.id}")
+            return int(update_response.data.id)
+        print(f"Database Update Failed: {update_response.message}")
+        return None
+
+    async def scrape_article(self, article: NewsItemSchema) -> int | None:
         """
-        Private method to scrape an article and update it in the database.
+        Scrape a single article and update it in the database.
         """
         try:
             result = await self.crawl4ai_scraper.scrape_url(article.get_online_url())
             if result:
-                article.crawl4ai_result = result
-                update_response = self.database_service.update_news_item(
-                    article.id, article
-                )
-                if update_response.is_success():
-                    print(f"Database Update Success: ID {update_response.data.id}")
-                    return int(update_response.data.id)
-                else:
-                    print(f"Database Update Failed: {update_response.message}")
+                return self._save_scraped_data(article, result)
         except Exception as e:
             print(f"Error updating article: {e}")
         return None
 
+    async def decode_news_item_URL(self, article: NewsItemSchema) -> bool:
+        """
+        Decode the publisher URL of a Google News item, if not decoded yet, and update
+        the article in the database. Returns whether the article was updated.
+        """
+        if article.extracted_URL:
+            return False
+        decoded_url = await self.gnews_decoder_service.decode(article.data_URL)
+        if str(decoded_url) == str(article.data_URL):
+            return False
+        article.extracted_URL = decoded_url
+        update_response = self.database_service.update_news_item(article.id, article)
+        if not update_response.is_success():
+            print(f"Database Update Failed: {update_response.message}")
+        return update_response.is_success()
+
+    async def enrich_article(self, article: NewsItemSchema) -> int | None:
+        """
+        Generate the missing summary and/or category of a single scraped article with
+        one LLM call, and update it in the database.
+        """
+        if not await self._analyze_article(article):
+            return None
+        update_response = self.database_service.update_news_item(article.id, article)
+        if update_response.is_success():
+            print(f"Database Update Success (Enrichment): ID {update_response.data.id}")
+            return int(update_response.data.id)
+        print(f"Database Update Failed (Enrichment): {update_response.message}")
+        return None
+
+    def backfill_display_fields(self, page_size: int = 500) -> list[int]:
+        """
+        Precompute display fields for news items ingested before they existed, a page
+        of rows at a time. Article bodies are not loaded: any scraped item is taken
+        to have article text.
+        """
+        updated_ids = []
+        while True:
+            db_query = self.database_service.query_select_news_items_from_db(
+                filters={"is_article_text_available": "null"},
+                columns=DISPLAY_BACKFILL_COLUMNS,
+            ).limit(page_size)
+            db_query_response = db_query.execute()
+            if not db_query_response.data:
+                break
+
+            # Updated rows drop out of the filter, so the next page is the first again
+            page_updated_ids = []
+            for item in db_query_response.data:
+                try:
+                    article = NewsItemListSchema(**item)
+                    article.refresh_display_fields()
+                    if self.database_service.update_news_item_display_fields(
+                        article.id, article
+                    ):
+                        page_updated_ids.append(article.id)
+                except Exception as e:
+                    print(f"Error computing display fields: {e}")
+            if not page_updated_ids:
+                print("No display fields could be updated, stopping the backfill.")
+                break
+            updated_ids += page_updated_ids
+            print(f"Backfilled display fields of {len(updated_ids)} articles")
+        return updated_ids
+
+    def migrate_inline_content_to_store(self) -> list[int]:
+        """
+        Move scraped bodies still stored inline in crawl4ai_result into the content store.
+        """
+        db_query = self.database_service.query_select_news_items_from_db(
+            filters={"content_hash": "null"},
+            not_null_fields=["crawl4ai_result"],
+        )
+        db_query_response = db_query.execute()
+
+        migrated_ids = []
+        for item in db_query_response.data or []:
+            try:
+                article = NewsItemSchema(**item)
+                migrated_id = self._save_scraped_data(article, article.crawl4ai_result)
+                if migrated_id:
+                    migrated_ids.append(migrated_id)
+            except Exception as e:
+                print(f"Error migrating article content: {e}")
+        return migrated_ids
+
     async def scrape_articles(self) -> list[int]:
         """
         Using the crawl4ai scraper, scrape articles that require scraping, and update the database.
+        Scrapes run concurrently through the scrape scheduler, with a per-host limit, and each
+        article is saved as soon as its scrape finishes. The shared browser is shut down afterwards.
         """
         db_query = self.database_service.query_select_news_items_from_db(
             filters={
                 "crawl4ai_result": "null",
+                "content_hash": "null",
+                "duplicate_of_data_URL": "null",
             }
         )
         db_query_response = db_query.execute()
@@ -188,14 +831,28 @@ class NewsItemService:
             else []
         )
 
-        news_items_ids = []
+        articles_by_url: dict[str, list[NewsItemSchema]] = {}
         for article in articles_requiring_scraping:
-            try:
-                updated_id = await self._update_article_with_scraped_data(article)
+            articles_by_url.setdefault(article.get_online_url(), []).append(article)
+
+        news_items_ids = []
+
+        def save_result(url: str, result: dict | None):
+            if not result:
+                return
+            for article in articles_by_url[url]:
+                updated_id = self._save_scraped_data(article, result)
                 if updated_id:
                     news_items_ids.append(updated_id)
-            except Exception as e:
-                print(f"Error scraping article: {e}")
+
+        try:
+            await self.scrape_scheduler.run(
+                list(articles_by_url),
+                self.crawl4ai_scraper.scrape_url,
+                on_result=save_result,
+            )
+        finally:
+            await self.crawl4ai_scraper.close()
 
         return news_items_ids
 
@@ -214,11 +871,15 @@ class NewsItemService:
             else []
         )
 
+        decoded_URLs = await self.gnews_decoder_service.decode_many(
+            [article.data_URL for article in articles_with_null_extracted_url]
+        )
+
         updated_article_ids = []
         for article in articles_with_null_extracted_url:
             try:
-                # Decode the URL to get the extracted URL
-                decoded_url = decode_gnews_url(article.data_URL)
+                # Use the decoded URL as the extracted URL
+                decoded_url = decoded_URLs.get(article.data_URL, article.data_URL)
                 if str(decoded_url) != str(article.data_URL):
                     article.extracted_URL = decoded_url
 
@@ -233,21 +894,31 @@ class NewsItemService:
                     print(f"Database Update Failed: {update_response.message}")
             except Exception as e:
                 print(f"Error updating article: {e}")
-            updated_id = await self._update_article_with_scraped_data(article)
+            updated_id = await self.scrape_article(article)
             if updated_id:
                 updated_article_ids.append(updated_id)
 
+        await self.crawl4ai_scraper.close()
         return updated_article_ids
 
+    def _print_llm_cache_stats(self):
+        cache_stats = self.openai_service.get_cache_stats()
+        if cache_stats:
+            print(
+                f"LLM cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                f"({cache_stats['hit_rate']:.0%} hit rate)"
+            )
+
     async def _generate_summary(self, article: NewsItemSchema) -> int | None:
         """
         Generate a summary for the given article and update it in the database.
         """
         try:
             article_text = article.get_article_text()
-            article.generated_summary = await self.openai_service.generate_summary(
+            article.generated_summary = await self.openai_service.summarize_article(
                 article_text
             )
+            article.refresh_display_fields()
 
             update_response = self.database_service.update_news_item(
                 article.id, article
@@ -263,38 +934,89 @@ class NewsItemService:
             print(f"Error generating summary: {e}")
         return None
 
+    @staticmethod
+    def _get_classification_text(article: NewsItemSchema) -> str:
+        """
+        Text to categorize an article by: its title and summary, then its body.
+        """
+        parts = [
+            article.get_title(),
+            article.get_article_summary(),
+            article.get_article_text(),
+        ]
+        return "\n\n".join(part for part in parts if part)
+
+    def _save_category(self, article: NewsItemSchema) -> int | None:
+        """
+        Update the generated category of the article in the database.
+        """
+        update_response = self.database_service.update_news_item(article.id, article)
+        if update_response.is_success():
+            print(f"Database Update Success (Category): ID {update_response.data.id}")
+            return int(update_response.data.id)
+        else:
+            print(f"Database Update Failed (Category): {update_response.message}")
+        return None
+
     async def _generate_category(self, article: NewsItemSchema) -> int | None:
         """
-        Generate a category for the given article and update it in the database.
+        Generate a category for the given article with the LLM and update it in the database.
         """
         try:
             article_text = article.get_article_text()
             article.generated_category = await self.openai_service.assign_category(
                 article_text
             )
-
-            update_response = self.database_service.update_news_item(
-                article.id, article
-            )
-            if update_response.is_success():
-                print(
-                    f"Database Update Success (Category): ID {update_response.data.id}"
-                )
-                return int(update_response.data.id)
-            else:
-                print(f"Database Update Failed (Category): {update_response.message}")
+            return self._save_category(article)
         except Exception as e:
             print(f"Error generating category: {e}")
         return None
 
+    async def _classify_articles(self, articles: list[NewsItemSchema]) -> list[int]:
+        """
+        Categorize articles with the local classifier, which only falls back to the
+        LLM for low-confidence predictions, and update them in the database.
+        Articles are embedded in batches; a batch whose embeddings request fails
+        (e.g. no embeddings model available) is categorized with the LLM instead.
+        """
+        categorized_ids = []
+        batch_size = self.category_classifier_service.batch_size
+        for start in range(0, len(articles), batch_size):
+            batch = articles[start : start + batch_size]
+            try:
+                predicted_categories = (
+                    await self.category_classifier_service.classify_many(
+                        [self._get_classification_text(article) for article in batch]
+                    )
+                )
+            except Exception as e:
+                print(f"Error classifying articles, falling back to the LLM: {e}")
+                categorized_ids += await asyncio.gather(
+                    *(self._generate_category(article) for article in batch)
+                )
+                continue
+
+            for article, category in zip(batch, predicted_categories):
+                if not category:
+                    continue
+                article.generated_category = category
+                try:
+                    categorized_ids.append(self._save_category(article))
+                except Exception as e:
+                    print(f"Error saving category: {e}")
+        return [article_id for article_id in categorized_ids if article_id]
+
     async def summarize_articles(self) -> list[int]:
         """
-        Generate summaries for articles with null 'generated_summary' and not null 'crawl4ai_result'.
+        Generate summaries for articles with null 'generated_summary' and scraped content.
         """
         db_query = self.database_service.query_select_news_items_from_db(
-            not_null_fields=["crawl4ai_result"],
-            filters={"is_removed_from_display": False, "generated_summary": "null"},
-        )
+            filters={
+                "is_removed_from_display": False,
+                "generated_summary": "null",
+                "duplicate_of_data_URL": "null",
+            },
+        ).or_(SCRAPED_CONTENT_FILTER)
         db_query_response = db_query.execute()
 
         articles_requiring_summary = (
@@ -307,16 +1029,20 @@ class NewsItemService:
             self._generate_summary(article) for article in articles_requiring_summary
         ]
         summarized_ids = await asyncio.gather(*tasks)
+        self._print_llm_cache_stats()
         return [article_id for article_id in summarized_ids if article_id]
 
     async def categorize_articles(self) -> list[int]:
         """
-        Generate categories for articles with null 'generated_category' and not null 'crawl4ai_result'.
+        Generate categories for articles with null 'generated_category' and scraped content.
         """
         db_query = self.database_service.query_select_news_items_from_db(
-            not_null_fields=["crawl4ai_result"],
-            filters={"is_removed_from_display": False, "generated_category": "null"},
-        )
+            filters={
+                "is_removed_from_display": False,
+                "generated_category": "null",
+                "duplicate_of_data_URL": "null",
+            },
+        ).or_(SCRAPED_CONTENT_FILTER)
         db_query_response = db_query.execute()
 
         articles_requiring_category = (
@@ -325,11 +1051,175 @@ class NewsItemService:
             else []
         )
 
+        if self.category_classifier_service:
+            categorized_ids = await self._classify_articles(articles_requiring_category)
+        else:
+            tasks = [
+                self._generate_category(article)
+                for article in articles_requiring_category
+            ]
+            categorized_ids = await asyncio.gather(*tasks)
+        self._print_llm_cache_stats()
+        return [article_id for article_id in categorized_ids if article_id]
+
+    def fetch_categorized_articles(self) -> list[NewsItemSchema]:
+        """
+        Fetch scraped articles whose category is one of the fixed categories,
+        e.g. to fit or evaluate the category classifier.
+        """
+        db_query = self.database_service.query_select_news_items_from_db(
+            filters={"generated_category": categories},
+        ).or_(SCRAPED_CONTENT_FILTER)
+        db_query_response = db_query.execute()
+        return [NewsItemSchema(**item) for item in db_query_response.data or []]
+
+    @staticmethod
+    def _apply_analysis(article: NewsItemSchema, analysis: dict | None) -> bool:
+        """
+        Fill in the missing summary and/or category of the article from an LLM analysis.
+        An analysis without a known category marks the article UNCATEGORIZED.
+        Returns whether the article was changed.
+        """
+        if not analysis:
+            return False
+
+        changed = False
+        if not article.generated_summary and analysis["summary"]:
+            article.generated_summary = analysis["summary"]
+            changed = True
+        if not article.generated_category:
+            article.generated_category = analysis["category"] or UNCATEGORIZED
+            changed = True
+        if changed:
+            article.refresh_display_fields()
+        return changed
+
+    async def _analyze_article(self, article: NewsItemSchema) -> bool:
+        """
+        Generate the missing summary and/or category of the given article with a single
+        LLM call. Returns whether the article was changed.
+        """
+        try:
+            analysis = await self.openai_service.analyze_article(
+                article.get_article_text()
+            )
+            return self._apply_analysis(article, analysis)
+        except Exception as e:
+            print(f"Error analyzing article: {e}")
+        return False
+
+    def _fetch_articles_requiring_enrichment(self) -> list[NewsItemSchema]:
+        """
+        Fetch scraped articles on display missing a generated summary or category.
+        Articles whose scraped content has no usable text are left out, since there
+        is nothing to analyze.
+        """
+        db_query = (
+            self.database_service.query_select_news_items_from_db(
+                filters={
+                    "is_removed_from_display": False,
+                    "duplicate_of_data_URL": "null",
+                },
+            )
+            .or_(SCRAPED_CONTENT_FILTER)
+            .or_("generated_summary.is.null,generated_category.is.null")
+            .not_.is_("is_article_text_available", "false")
+        )
+        db_query_response = db_query.execute()
+
+        articles = [NewsItemSchema(**item) for item in db_query_response.data or []]
+        return [article for article in articles if article.has_article_text()]
+
+    def _save_enriched_articles(self, enriched_articles: list[NewsItemSchema]):
+        """
+        Write the generated fields of enriched articles back and return their IDs.
+        Only those fields are written, since the articles were read before the LLM
+        calls and the rest of each row may have been edited since.
+        """
+        updated_ids = []
+        for article in enriched_articles:
+            if self.database_service.update_news_item_enrichment_fields(
+                article.id, article
+            ):
+                updated_ids.append(int(article.id))
+            else:
+                print(f"Database Update Failed (Enrichment): {article.id}")
+        return updated_ids
+
+    async def enrich_articles(self) -> list[int]:
+        """
+        Generate summaries and categories for scraped articles missing either, with one
+        LLM call per article, and write the results back.
+        """
+        articles_requiring_enrichment = self._fetch_articles_requiring_enrichment()
+
         tasks = [
-            self._generate_category(article) for article in articles_requiring_category
+            self._analyze_article(article) for article in articles_requiring_enrichment
         ]
-        categorized_ids = await asyncio.gather(*tasks)
-        return [article_id for article_id in categorized_ids if article_id]
+        changed = await asyncio.gather(*tasks)
+        self._print_llm_cache_stats()
+        return self._save_enriched_articles(
+            [
+                article
+                for article, is_changed in zip(articles_requiring_enrichment, changed)
+                if is_changed
+            ]
+        )
+
+    async def enrich_articles_in_batch(
+        self, poll_interval_seconds=60, timeout_seconds=None
+    ) -> list[int]:
+        """
+        Generate summaries and categories for scraped articles missing either through the
+        OpenAI Batch API, for backfills that don't need interactive latency.
+        Waits for the batch to finish, then writes the results back.
+        """
+        articles_requiring_enrichment = self._fetch_articles_requiring_enrichment()[
+            : self.BATCH_MAX_REQUESTS
+        ]
+        if not articles_requiring_enrichment:
+            return []
+
+        articles_by_custom_id = {
+            f"news-item-{article.id}": article
+            for article in articles_requiring_enrichment
+        }
+        batch_requests = []
+        for custom_id, article in articles_by_custom_id.items():
+            # Articles without text get no request, so no analysis is saved for them
+            article_text = article.get_article_text()
+            if not article_text:
+                continue
+            try:
+                batch_requests.append(
+                    self.openai_service.build_analysis_batch_request(
+                        custom_id, article_text
+                    )
+                )
+            except Exception as e:
+                print(f"Error building batch request for {custom_id}: {e}")
+        if not batch_requests:
+            return []
+
+        with tempfile.TemporaryDirectory() as batch_directory:
+            batch_file_path = os.path.join(batch_directory, "enrich_articles.jsonl")
+            self.openai_service.write_batch_file(batch_requests, batch_file_path)
+            batch_id = await self.openai_service.submit_batch(batch_file_path)
+
+        batch = await self.openai_service.wait_for_batch(
+            batch_id,
+            poll_interval_seconds=poll_interval_seconds,
+            timeout_seconds=timeout_seconds,
+        )
+        analyses = await self.openai_service.fetch_analysis_batch_results(batch)
+
+        return self._save_enriched_articles(
+            [
+                article
+                for custom_id, article in articles_by_custom_id.items()
+                if self._apply_analysis(article, analyses.get(custom_id))
+            ]
+        )
 
     def download_selected_articles_as_csv(self, output_file_path: str):
         """
@@ -339,7 +1229,8 @@ class NewsItemService:
             filters={
                 "is_selected_for_download": True,
                 "is_removed_from_display": False,
-            }
+            },
+            columns=NEWS_ITEM_LIST_COLUMNS,
         )
         db_query_response = db_query.execute()
 
@@ -347,7 +1238,7 @@ class NewsItemService:
             print("No articles found for download.")
             return
 
-        articles = [NewsItemSchema(**item) for item in db_query_response.data]
+        articles = [NewsItemListSchema(**item) for item in db_query_response.data]
 
         try:
             with open(
@@ -1,9 +1,29 @@
 import os
+import json
+import asyncio
+import random
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
+from openai import (
+    AsyncOpenAI,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+
+from .llm_cache_service import LLMCacheService
+from .llm_rate_limiter import LLMRateLimiter
+from ..utils.llm_input import build_llm_input, chunk_text, count_tokens
 
 load_dotenv()
 
+# Bump a prompt's version when editing it, so its cached results are not reused
+PROMPT_VERSIONS = {
+    "category": "1",
+    "summary": "1",
+    "analysis": "1",
+}
+
 categories = [
     "Government Policy & Regulatory Updates",
     "Financial Incentives & Housing Programs",
@@ -12,9 +32,53 @@ categories = [
     "Housing Market Trends & Demographic Insights",
 ]
 
+# Saved for articles the LLM could not assign one of the categories to, so they are
+# not categorized (and billed) again on every run
+UNCATEGORIZED = "Uncategorized"
+
+
+# Batch API settings
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Maximum number of inputs per embeddings request
+EMBEDDING_BATCH_SIZE = 256
+
+# Errors worth retrying, with backoff
+RETRYABLE_ERRORS = (
+    RateLimitError,
+    APITimeoutError,
+    APIConnectionError,
+    InternalServerError,
+)
+
 
 class OpenAIService:
-    def __init__(self, organization=None, project=None):
+    def __init__(
+        self,
+        organization=None,
+        project=None,
+        cache: LLMCacheService = None,
+        rate_limiter: LLMRateLimiter = None,
+        max_concurrency=8,
+        max_retries=5,
+        max_backoff_seconds=60,
+        input_token_budget=3000,
+        map_reduce_threshold_tokens=12000,
+        chunk_tokens=3000,
+        max_chunks=8,
+    ):
+        self.cache = cache
+        self.rate_limiter = rate_limiter or LLMRateLimiter()
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.max_backoff_seconds = max_backoff_seconds
+        self.input_token_budget = input_token_budget
+        self.map_reduce_threshold_tokens = map_reduce_threshold_tokens
+        self.chunk_tokens = chunk_tokens
+        self.max_chunks = max_chunks
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.config = {
             "api_key": self.openai_api_key or "doesntmatter",
@@ -29,25 +93,184 @@ class OpenAIService:
         self.summarization_model = (
             "mistral-nemo" if not self.openai_api_key else "gpt-4o"
         )
+        self.embedding_model = (
+            "nomic-embed-text" if not self.openai_api_key else "text-embedding-3-small"
+        )
         self.async_openai_client = AsyncOpenAI(
             api_key=self.config["api_key"],
             base_url=self.config["base_url"],
             organization=self.config["organization"],
             project=self.config["project"],
+            # Retries are handled by _create_chat_completion
+            max_retries=0,
         )
 
     def get_client(self):
         return self.async_openai_client
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Return the semaphore capping concurrent LLM calls, for the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    @staticmethod
+    def estimate_tokens(messages: list[dict], max_tokens: int) -> int:
+        """
+        Roughly estimate the tokens used by a request (about 4 characters per token).
+        """
+        prompt_characters = sum(len(message["content"]) for message in messages)
+        return prompt_characters // 4 + max_tokens
+
+    def _get_retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter, waiting at least as long as the
+        retry-after header of the error's response, if any.
+        """
+        delay = random.uniform(0, min(self.max_backoff_seconds, 2**attempt))
+
+        response = getattr(error, "response", None)
+        if response is not None:
+            try:
+                if response.headers.get("retry-after-ms"):
+                    retry_after = float(response.headers["retry-after-ms"]) / 1000
+                else:
+                    retry_after = float(response.headers.get("retry-after", 0))
+                delay = max(delay, retry_after)
+            except (TypeError, ValueError):
+                pass
+        return delay
+
+    async def _call_with_retries(self, create, estimated_tokens: int, **kwargs):
+        """
+        Call an API method under the rate limiter and concurrency cap,
+        retrying rate limit, timeout, connection and server errors with backoff.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire(estimated_tokens)
+            try:
+                async with self._get_semaphore():
+                    response = await create(**kwargs)
+                if getattr(response, "usage", None):
+                    self.rate_limiter.record_usage(
+                        estimated_tokens, response.usage.total_tokens
+                    )
+                return response
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self._get_retry_delay(e, attempt)
+                print(
+                    f"LLM request failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1} of {self.max_retries})"
+                )
+                await asyncio.sleep(delay)
+
+    async def _create_chat_completion(self, **kwargs):
+        """
+        Create a chat completion, rate limited and retried.
+        """
+        estimated_tokens = self.estimate_tokens(
+            kwargs["messages"], kwargs.get("max_tokens") or 0
+        )
+        return await self._call_with_retries(
+            self.async_openai_client.chat.completions.create,
+            estimated_tokens,
+            **kwargs,
+        )
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed the texts (each trimmed to the input token budget), in batches of
+        EMBEDDING_BATCH_SIZE inputs per request.
+        """
+        inputs = [
+            self.prepare_input(text, self.embedding_model) or " " for text in texts
+        ]
+        embeddings = []
+        for start in range(0, len(inputs), EMBEDDING_BATCH_SIZE):
+            batch_inputs = inputs[start : start + EMBEDDING_BATCH_SIZE]
+            response = await self._call_with_retries(
+                self.async_openai_client.embeddings.create,
+                sum(count_tokens(text, self.embedding_model) for text in batch_inputs),
+                model=self.embedding_model,
+                input=batch_inputs,
+            )
+            embeddings.extend(
+                item.embedding for item in sorted(response.data, key=lambda d: d.index)
+            )
+        return embeddings
+
+    def get_cache_stats(self) -> dict | None:
+        return self.cache.get_stats() if self.cache else None
+
+    def _get_cache_key(self, prompt_name, text, model, params: dict) -> str | None:
+        if not self.cache:
+            return None
+        return self.cache.make_key(text, model, PROMPT_VERSIONS[prompt_name], params)
+
+    def _get_cached_result(self, cache_key):
+        if not cache_key:
+            return None
+        return self.cache.get(cache_key)
+
+    def _set_cached_result(self, cache_key, result):
+        if cache_key and result is not None:
+            self.cache.set(cache_key, result)
+
+    def prepare_input(self, text, model) -> str:
+        """
+        Trim the text to the input token budget, keeping the lead of the article.
+        """
+        return build_llm_input(text, self.input_token_budget, model)
+
+    async def condense_text(self, text, model) -> str:
+        """
+        Return the text unchanged, or for articles longer than the map-reduce
+        threshold, the summaries of its chunks (summarized concurrently), in order.
+        """
+        if count_tokens(text, model) <= self.map_reduce_threshold_tokens:
+            return text
+
+        chunks = chunk_text(text, self.chunk_tokens, model)[: self.max_chunks]
+        chunk_summaries = await asyncio.gather(
+            *(self.generate_summary(chunk) for chunk in chunks)
+        )
+        chunk_summaries = [summary for summary in chunk_summaries if summary]
+        if not chunk_summaries:
+            return text
+        return "\n\n".join(chunk_summaries)
+
+    async def summarize_article(self, text, max_tokens=100):
+        """
+        Summarize an article of any length: long articles are summarized chunk by
+        chunk first, and the chunk summaries merged into one summary.
+        """
+        if not text:
+            return None
+        condensed_text = await self.condense_text(text, self.summarization_model)
+        return await self.generate_summary(condensed_text, max_tokens)
+
     async def assign_category(self, text):
+        text = self.prepare_input(text, self.classification_model)
         system_prompt = (
             f"You are a strict categorization assistant. You will be given text delimited by triple quotes."
             f"Using the given text, your task is to either return ONLY ONE category from the following list: {' '.join(categories)} or respond with I don't know."
             f"Do not explain your choice. Do not include any other text or punctuation."
         )
         user_prompt = f"Text: '''{text}'''"
+        cache_key = self._get_cache_key(
+            "category", text, self.classification_model, {"max_tokens": 8}
+        )
+        cached_category = self._get_cached_result(cache_key)
+        if cached_category is not None:
+            return cached_category
         try:
-            response = await self.async_openai_client.chat.completions.create(
+            response = await self._create_chat_completion(
                 stream=False,
                 model=self.classification_model,
                 messages=[
@@ -60,19 +283,27 @@ class OpenAIService:
             category = response.choices[0].message.content.strip()
             if not category:
                 return None
+            self._set_cached_result(cache_key, category)
             return category
         except Exception as e:
             print(f"Error assigning category with OpenAI: {e}")
             return None
 
     async def generate_summary(self, text, max_tokens=100):
+        text = self.prepare_input(text, self.summarization_model)
         system_prompt = (
             "You are a strict summarization assistant. You will be given text delimited by triple quotes."
             "Your task is to summarize the text in a concise manner."
         )
         user_prompt = f"Text: '''{text}''' "
+        cache_key = self._get_cache_key(
+            "summary", text, self.summarization_model, {"max_tokens": max_tokens}
+        )
+        cached_content = self._get_cached_result(cache_key)
+        if cached_content is not None:
+            return cached_content
         try:
-            response = await self.async_openai_client.chat.completions.create(
+            response = await self._create_chat_completion(
                 stream=False,
                 model=self.summarization_model,
                 messages=[
@@ -87,7 +318,177 @@ class OpenAIService:
             content = response.choices[0].message.content.strip()
             if not content:
                 return None
+            self._set_cached_result(cache_key, content)
             return content
         except Exception as e:
             print(f"Error summarizing with OpenAI: {e}")
             return None
+
+    @staticmethod
+    def _match_category(category) -> str | None:
+        """
+        Return the category from the fixed list matching the given one, if any.
+        """
+        if not isinstance(category, str):
+            return None
+        normalized_category = category.strip().strip(".").lower()
+        for known_category in categories:
+            if known_category.lower() == normalized_category:
+                return known_category
+        return None
+
+    def _build_analysis_request_body(self, text, max_summary_tokens=100) -> dict:
+        """
+        Build the chat completion request body summarizing and categorizing the text.
+        """
+        system_prompt = (
+            "You are a strict summarization and categorization assistant. You will be given text delimited by triple quotes."
+            "Your task is to summarize the text in a concise manner, and to assign it ONLY ONE category "
+            f"from the following list: {'; '.join(categories)}, or respond with I don't know as the category."
+            'Respond only with a JSON object of the form {"summary": "...", "category": "..."}.'
+        )
+        user_prompt = f"Text: '''{text}''' "
+        return {
+            "model": self.summarization_model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 0.0,
+            # room for the JSON structure and the category on top of the summary
+            "max_tokens": max_summary_tokens + 50,
+        }
+
+    def _parse_analysis(self, content: str) -> dict:
+        """
+        Parse the JSON content of an analysis completion.
+        """
+        parsed_content = json.loads(content)
+        summary = parsed_content.get("summary")
+        return {
+            "summary": summary.strip() if isinstance(summary, str) else None,
+            "category": self._match_category(parsed_content.get("category")),
+        }
+
+    async def analyze_article(self, text, max_summary_tokens=100) -> dict | None:
+        """
+        Summarize and categorize the text in a single structured (JSON) completion.
+        Returns a dictionary with "summary" and "category" (None if not one of the
+        known categories), or None on failure or without text.
+        """
+        if not text:
+            return None
+        text = self.prepare_input(
+            await self.condense_text(text, self.summarization_model),
+            self.summarization_model,
+        )
+        cache_key = self._get_cache_key(
+            "analysis",
+            text,
+            self.summarization_model,
+            {"max_summary_tokens": max_summary_tokens},
+        )
+        cached_analysis = self._get_cached_result(cache_key)
+        if cached_analysis is not None:
+            return cached_analysis
+        try:
+            response = await self._create_chat_completion(
+                stream=False,
+                **self._build_analysis_request_body(text, max_summary_tokens),
+            )
+            analysis = self._parse_analysis(response.choices[0].message.content)
+            if analysis["summary"]:
+                self._set_cached_result(cache_key, analysis)
+            return analysis
+        except Exception as e:
+            print(f"Error analyzing article with OpenAI: {e}")
+            return None
+
+    # BATCH METHODS
+    def build_analysis_batch_request(
+        self, custom_id: str, text, max_summary_tokens=100
+    ) -> dict:
+        """
+        Build one line of a Batch API input file, analyzing the text.
+        Long texts are trimmed to the input token budget rather than condensed,
+        since condensing them would take live requests.
+        """
+        text = self.prepare_input(text, self.summarization_model)
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": self._build_analysis_request_body(text, max_summary_tokens),
+        }
+
+    @staticmethod
+    def write_batch_file(batch_requests: list[dict], file_path: str):
+        """
+        Write Batch API requests to a JSONL file.
+        """
+        with open(file_path, mode="w", encoding="utf-8") as batch_file:
+            for batch_request in batch_requests:
+                batch_file.write(json.dumps(batch_request) + "\n")
+
+    async def submit_batch(self, file_path: str) -> str:
+        """
+        Upload a JSONL batch file and create a batch from it. Returns the batch ID.
+        """
+        with open(file_path, mode="rb") as batch_file:
+            uploaded_file = await self.async_openai_client.files.create(
+                file=batch_file, purpose="batch"
+            )
+        batch = await self.async_openai_client.batches.create(
+            input_file_id=uploaded_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        print(f"Submitted batch {batch.id} from {file_path}")
+        return batch.id
+
+    async def wait_for_batch(
+        self, batch_id: str, poll_interval_seconds=60, timeout_seconds=None
+    ):
+        """
+        Poll a batch until it completes, fails, expires or is cancelled, and return it.
+        """
+        waited_seconds = 0
+        while True:
+            batch = await self.async_openai_client.batches.retrieve(batch_id)
+            if batch.status in BATCH_TERMINAL_STATUSES:
+                print(f"Batch {batch_id} finished with status {batch.status}")
+                return batch
+            if timeout_seconds is not None and waited_seconds >= timeout_seconds:
+                raise TimeoutError(
+                    f"Batch {batch_id} still {batch.status} after {waited_seconds}s"
+                )
+            print(f"Batch {batch_id} is {batch.status}, checking again later...")
+            await asyncio.sleep(poll_interval_seconds)
+            waited_seconds += poll_interval_seconds
+
+    async def fetch_analysis_batch_results(self, batch) -> dict[str, dict | None]:
+        """
+        Download the output of a completed analysis batch.
+        Returns a mapping of each custom_id to its analysis, or None if it failed.
+        """
+        if not batch.output_file_id:
+            return {}
+
+        output = await self.async_openai_client.files.content(batch.output_file_id)
+        analyses = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            try:
+                response = result.get("response") or {}
+                if response.get("status_code") != 200:
+                    raise ValueError(result.get("error") or response)
+                analyses[result["custom_id"]] = self._parse_analysis(
+                    response["body"]["choices"][0]["message"]["content"]
+                )
+            except Exception as e:
+                print(f"Error in batch result {result.get('custom_id')}: {e}")
+                analyses[result.get("custom_id")] = None
+        return analyses
@@ -0,0 +1,196 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+from .job_service import Job, JobService
+
+
+class ScheduledTask:
+    """
+    An operation run periodically by the scheduler, with the timings of its last run.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        operation: Callable[[], Awaitable[Any]],
+        interval_seconds: float,
+        jitter_seconds: float = 0,
+    ):
+        self.name = name
+        self.operation = operation
+        self.interval_seconds = interval_seconds
+        self.jitter_seconds = jitter_seconds
+        self.next_run_at = time.monotonic() + random.uniform(0, jitter_seconds)
+        self.job: Optional[Job] = None
+        self.run_count = 0
+        self.skipped_count = 0
+        self.last_status: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.last_started_at: Optional[datetime] = None
+        self.last_finished_at: Optional[datetime] = None
+        self.last_duration_seconds: Optional[float] = None
+
+    def schedule_next_run(self):
+        """
+        Schedule the next run one interval from now, delayed by a random jitter so
+        tasks with equal intervals drift apart instead of always running together.
+        """
+        self.next_run_at = (
+            time.monotonic()
+            + self.interval_seconds
+            + random.uniform(0, self.jitter_seconds)
+        )
+
+    def is_due(self) -> bool:
+        return time.monotonic() >= self.next_run_at
+
+    def is_running(self) -> bool:
+        """
+        Whether the job of the previous run is still queued or running.
+        """
+        return self.job is not None and not self.job.is_finished()
+
+    async def run(self) -> Any:
+        """
+        Run the operation once, recording its timings and outcome.
+        """
+        self.last_started_at = datetime.now(timezone.utc)
+        started = time.monotonic()
+        try:
+            result = await self.operation()
+            self.last_status = "succeeded"
+            self.last_error = None
+            return result
+        except Exception as e:
+            self.last_status = "failed"
+            self.last_error = str(e)
+            raise
+        finally:
+            self.run_count += 1
+            self.last_finished_at = datetime.now(timezone.utc)
+            self.last_duration_seconds = round(time.monotonic() - started, 1)
+            print(
+                f"Scheduled task {self.name} {self.last_status} "
+                f"in {self.last_duration_seconds}s"
+            )
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "interval_seconds": self.interval_seconds,
+            "next_run_in_seconds": round(
+                max(self.next_run_at - time.monotonic(), 0), 1
+            ),
+            "is_running": self.is_running(),
+            "job_id": self.job.id if self.job else None,
+            "run_count": self.run_count,
+            "skipped_count": self.skipped_count,
+            "last_status": self.last_status,
+            "last_error": self.last_error,
+            "last_started_at": (
+                self.last_started_at.isoformat() if self.last_started_at else None
+            ),
+            "last_finished_at": (
+                self.last_finished_at.isoformat() if self.last_finished_at else None
+            ),
+            "last_duration_seconds": self.last_duration_seconds,
+        }
+
+
+class PeriodicScheduler:
+    """
+    Runs crawling, scraping and enrichment periodically as background jobs, so the
+    database is kept up to date by frequent small runs rather than occasional
+    large ones triggered by hand.
+
+    Each task has its own interval and jitter. A task whose previous run is still
+    queued or running is skipped until its next interval, so runs never overlap.
+    The scheduler runs either in a background thread of the web app (start) or in
+    the foreground of a standalone worker (run_forever).
+    """
+
+    def __init__(
+        self,
+        job_service: JobService,
+        tick_seconds: float = 30,
+        jitter_ratio: float = 0.1,
+    ):
+        self.job_service = job_service
+        self.tick_seconds = tick_seconds
+        self.jitter_ratio = jitter_ratio
+        self.tasks: dict[str, ScheduledTask] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_task(
+        self,
+        name: str,
+        operation: Callable[[], Awaitable[Any]],
+        interval_seconds: float,
+    ) -> ScheduledTask:
+        """
+        Add a coroutine function to run every interval_seconds (plus jitter).
+        """
+        task = ScheduledTask(
+            name,
+            operation,
+            interval_seconds,
+            jitter_seconds=interval_seconds * self.jitter_ratio,
+        )
+        self.tasks[name] = task
+        return task
+
+    def run_pending(self) -> list[ScheduledTask]:
+        """
+        Submit a job for each task that is due and not still running. Returns the
+        tasks started.
+        """
+        started_tasks = []
+        for task in self.tasks.values():
+            if not task.is_due():
+                continue
+            task.schedule_next_run()
+            if task.is_running():
+                task.skipped_count += 1
+                print(f"Skipping scheduled task {task.name}: previous run not finished")
+                continue
+            task.job = self.job_service.submit(f"scheduled-{task.name}", task.run)
+            started_tasks.append(task)
+        return started_tasks
+
+    def run_forever(self):
+        """
+        Run due tasks every tick until stop() is called.
+        """
+        print(f"Scheduler started with tasks: {', '.join(self.tasks)}")
+        while not self._stop_event.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                print(f"Error running scheduled tasks: {e}")
+            self._stop_event.wait(self.tick_seconds)
+        print("Scheduler stopped.")
+
+    def start(self):
+        """
+        Run the scheduler in a background thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.run_forever, name="scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get_task_timings(self) -> list[dict]:
+        return [task.to_dict() for task in self.tasks.values()]
@@ -1,4 +1,5 @@
 import os
+import asyncio
 from dotenv import load_dotenv
 import json
 from pydantic import BaseModel
@@ -35,10 +36,17 @@ class ArticleData(BaseModel):
 class Crawl4AIScraper:
     _patch_applied = False  # class-level flag to ensure we only patch once
 
-    def __init__(self):
+    def __init__(self, max_concurrent_pages: int = 5):
         """
         Initialize the scraper with reusable configurations.
+        A single browser is launched lazily and shared by all scrapes until close() is called,
+        with at most max_concurrent_pages pages open at once.
         """
+        self.max_concurrent_pages = max_concurrent_pages
+        self._crawler: AsyncWebCrawler | None = None
+        self._crawler_loop: asyncio.AbstractEventLoop | None = None
+        self._crawler_lock: asyncio.Lock | None = None
+        self._page_semaphore: asyncio.Semaphore | None = None
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
 
         if not Crawl4AIScraper._patch_applied:
@@ -137,28 +145,75 @@ class Crawl4AIScraper:
 
         return result
 
-    async def scrape_url(self, url) -> dict | None:
+    async def _get_crawler(self) -> AsyncWebCrawler:
+        """
+        Return the shared crawler, starting the browser on first use.
+        The browser is bound to the event loop that started it, so it is restarted
+        if called from a different loop (e.g. a new Flask async request).
+        """
+        loop = asyncio.get_running_loop()
+        if self._crawler_loop is not loop:
+            self._crawler = None
+            self._crawler_loop = loop
+            self._crawler_lock = asyncio.Lock()
+            self._page_semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+
+        async with self._crawler_lock:
+            if self._crawler is None:
+                crawler = AsyncWebCrawler(config=self.browser_config)
+                await crawler.start()
+                self._crawler = crawler
+        return self._crawler
+
+    async def close(self):
         """
-        Process a single URL asynchronously.
+        Shut down the shared browser, if one is running.
         """
-        async with AsyncWebCrawler(config=self.browser_config) as crawler:
+        crawler = self._crawler
+        self._crawler = None
+        if crawler and self._crawler_loop is asyncio.get_running_loop():
             try:
-                result = self._handle_result(
-                    await crawler.arun(url=url, config=self.run_config)
-                )
-                if result:
-                    return {
-                        "cleaned_html": result.cleaned_html,
-                        "raw_markdown": result.markdown.raw_markdown,
-                        "fit_markdown": result.markdown.fit_markdown,
-                        "fit_html": result.markdown.fit_html,
-                        "extracted_content": result.extracted_content,
-                        "metadata": result.metadata,
-                    }
-                else:
-                    print(f"Failed to extract data from {url}")
-
+                await crawler.close()
             except Exception as e:
-                print(f"Exception while processing {url}: {e}")
+                print(f"Exception while closing crawler: {e}")
+
+    async def __aenter__(self):
+        await self._get_crawler()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
 
+    def _result_to_dict(self, result: CrawlResult) -> dict | None:
+        """
+        Convert a crawl result into the dictionary stored on the news item.
+        """
+        result = self._handle_result(result)
+        if not result:
             return None
+        return {
+            "cleaned_html": result.cleaned_html,
+            "raw_markdown": result.markdown.raw_markdown,
+            "fit_markdown": result.markdown.fit_markdown,
+            "fit_html": result.markdown.fit_html,
+            "extracted_content": result.extracted_content,
+            "metadata": result.metadata,
+        }
+
+    async def scrape_url(self, url) -> dict | None:
+        """
+        Process a single URL asynchronously, using the shared browser, waiting for
+        a free page if max_concurrent_pages scrapes are already running.
+        """
+        try:
+            crawler = await self._get_crawler()
+            async with self._page_semaphore:
+                result = await crawler.arun(url=url, config=self.run_config)
+            scraped_data = self._result_to_dict(result)
+            if scraped_data:
+                return scraped_data
+            print(f"Failed to extract data from {url}")
+        except Exception as e:
+            print(f"Exception while processing {url}: {e}")
+
+        return None
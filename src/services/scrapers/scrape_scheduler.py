@@ -0,0 +1,111 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable
+from urllib.parse import urlparse
+
+from ..job_service import report_job_progress
+
+
+class ScrapeRunStats:
+    """
+    Counts and timing for a single scheduler run.
+    """
+
+    def __init__(self, total: int):
+        self.total = total
+        self.succeeded = 0
+        self.failed = 0
+        self.started_at = time.monotonic()
+        self.finished_at: float | None = None
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput_per_minute(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.completed / self.elapsed_seconds * 60
+
+    def __str__(self) -> str:
+        return (
+            f"{self.completed}/{self.total} scraped ({self.succeeded} succeeded, {self.failed} failed) "
+            f"in {self.elapsed_seconds:.1f}s, {self.throughput_per_minute:.1f} articles/min"
+        )
+
+
+class ScrapeScheduler:
+    """
+    Runs scrapes with a global concurrency limit and a per-host limit, so a large backlog
+    can be worked through in one run without hammering a single publisher.
+    """
+
+    def __init__(self, max_concurrency: int = 5, max_per_host: int = 2):
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        host = urlparse(url).netloc.lower()
+        return host[4:] if host.startswith("www.") else host
+
+    async def run(
+        self,
+        urls: list[str],
+        scrape: Callable[[str], Awaitable[Any]],
+        on_result: Callable[[str, Any], Any] = None,
+        progress_every: int = 25,
+    ) -> tuple[dict[str, Any], ScrapeRunStats]:
+        """
+        Scrape each URL with the given coroutine function.
+        on_result is called as soon as each scrape finishes, with the URL and its result
+        (None on failure). Returns the results by URL and the run statistics.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        stats = ScrapeRunStats(total=len(unique_urls))
+        results: dict[str, Any] = {}
+
+        global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        host_semaphores = defaultdict(lambda: asyncio.Semaphore(self.max_per_host))
+
+        async def scrape_one(url: str):
+            # Wait on the host first, so a busy host doesn't hold global slots
+            async with host_semaphores[self.get_host(url)]:
+                async with global_semaphore:
+                    try:
+                        result = await scrape(url)
+                    except Exception as e:
+                        print(f"Error scraping {url}: {e}")
+                        result = None
+
+            results[url] = result
+            if result:
+                stats.succeeded += 1
+            else:
+                stats.failed += 1
+
+            if on_result:
+                try:
+                    on_result(url, result)
+                except Exception as e:
+                    print(f"Error handling scrape result for {url}: {e}")
+
+            report_job_progress(
+                scraped=stats.completed,
+                scrape_total=stats.total,
+                scrape_failed=stats.failed,
+            )
+            if progress_every and stats.completed % progress_every == 0:
+                print(f"Scrape progress: {stats}")
+
+        await asyncio.gather(*(scrape_one(url) for url in unique_urls))
+
+        stats.finished_at = time.monotonic()
+        print(f"Scrape run finished: {stats}")
+        return results, stats
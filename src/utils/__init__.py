@@ -5,10 +5,22 @@ from .date_helpers import standardize_date_type_format, get_news_search_dates
 from .text_processing import (
     normalize_html_content,
     clean_and_normalize_text,
+    filter_text_for_llm,
     decode_gnews_url,
+    normalize_url,
+    TextCleaningRule,
+    TextCleaningEngine,
+    text_cleaning_engine,
+    get_text_cleaning_version,
 )
+from .llm_input import count_tokens, build_llm_input, chunk_text
+from .near_duplicates import NearDuplicateIndex
+from .sqlite_helpers import connect_sqlite
 
 __all__ = [
     "date_helpers",
     "text_processing",
+    "llm_input",
+    "near_duplicates",
+    "sqlite_helpers",
 ]
@@ -0,0 +1,108 @@
+import re
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # fall back to estimating tokens from characters
+    tiktoken = None
+
+# Rough number of characters per token, used when tiktoken is unavailable
+CHARACTERS_PER_TOKEN = 4
+
+PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n|\n")
+SENTENCE_BREAK_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str = None):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        pass
+    try:
+        # Local models (e.g. through Ollama) are not known to tiktoken
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str, model: str = None) -> int:
+    """Count the tokens of the text for the model, or estimate them."""
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return (len(text) + CHARACTERS_PER_TOKEN - 1) // CHARACTERS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = None) -> str:
+    """Truncate the text to at most max_tokens tokens."""
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return text[: max_tokens * CHARACTERS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    return encoding.decode(tokens[:max_tokens]) if len(tokens) > max_tokens else text
+
+
+def split_into_passages(text: str) -> list[str]:
+    """
+    Split text into paragraphs, or into sentences if it has no line breaks
+    (e.g. text whose whitespace was normalized).
+    """
+    if not text:
+        return []
+    passages = PARAGRAPH_BREAK_PATTERN.split(text.strip())
+    if len(passages) == 1:
+        passages = SENTENCE_BREAK_PATTERN.split(passages[0])
+    return [passage.strip() for passage in passages if passage.strip()]
+
+
+def build_llm_input(text: str, token_budget: int, model: str = None) -> str:
+    """
+    Trim text to the token budget, keeping whole passages from the start of the
+    article, since the lead carries most of a news story.
+    """
+    if not text or count_tokens(text, model) <= token_budget:
+        return text
+
+    kept_passages = []
+    remaining_tokens = token_budget
+    for passage in split_into_passages(text):
+        passage_tokens = count_tokens(passage, model) + 1
+        if passage_tokens > remaining_tokens:
+            if not kept_passages:
+                # The lead passage alone is over budget, so cut it
+                kept_passages.append(truncate_to_tokens(passage, token_budget, model))
+            break
+        kept_passages.append(passage)
+        remaining_tokens -= passage_tokens
+    return " ".join(kept_passages)
+
+
+def chunk_text(text: str, chunk_tokens: int, model: str = None) -> list[str]:
+    """
+    Split text into chunks of at most chunk_tokens tokens, packing whole passages
+    together and cutting passages that are longer than a chunk.
+    """
+    chunks = []
+    current_passages = []
+    current_tokens = 0
+    for passage in split_into_passages(text):
+        passage_tokens = count_tokens(passage, model) + 1
+        if passage_tokens > chunk_tokens:
+            passage = truncate_to_tokens(passage, chunk_tokens - 1, model)
+            passage_tokens = chunk_tokens
+        if current_passages and current_tokens + passage_tokens > chunk_tokens:
+            chunks.append(" ".join(current_passages))
+            current_passages = []
+            current_tokens = 0
+        current_passages.append(passage)
+        current_tokens += passage_tokens
+    if current_passages:
+        chunks.append(" ".join(current_passages))
+    return chunks
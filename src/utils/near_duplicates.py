@@ -0,0 +1,146 @@
+import hashlib
+import random
+import re
+from collections import defaultdict
+
+NON_WORD_PATTERN = re.compile(r"[^\w\s]+")
+
+# Universal hashing of 32-bit shingle hashes modulo a Mersenne prime
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+
+def shingle_text(text: str, shingle_size: int = 2) -> set[str]:
+    """
+    Split text into the set of its lowercased word n-grams, ignoring punctuation.
+    """
+    words = NON_WORD_PATTERN.sub(" ", (text or "").lower()).split()
+    if len(words) <= shingle_size:
+        return {" ".join(words)} if words else set()
+    return {
+        " ".join(words[i : i + shingle_size])
+        for i in range(len(words) - shingle_size + 1)
+    }
+
+
+class NearDuplicateIndex:
+    """
+    MinHash LSH index finding texts whose estimated Jaccard similarity (over word
+    shingles) with an indexed text is at least threshold.
+
+    Signatures of num_perm hashes are split into bands; texts sharing any band are
+    candidates, whose similarity is then estimated from their full signatures.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.6,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 2,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        generator = random.Random(seed)
+        self._permutations = [
+            (
+                generator.randint(1, MERSENNE_PRIME - 1),
+                generator.randint(0, MERSENNE_PRIME - 1),
+            )
+            for _ in range(num_perm)
+        ]
+        self._buckets: list[dict[tuple, list[str]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        self._signatures: dict[str, tuple[int, ...]] = {}
+
+    def empty_like(self) -> "NearDuplicateIndex":
+        """
+        Return an empty index with the same settings, whose signatures are comparable.
+        """
+        return NearDuplicateIndex(
+            self.threshold, self.num_perm, self.bands, self.shingle_size, self.seed
+        )
+
+    def clear(self):
+        for band_buckets in self._buckets:
+            band_buckets.clear()
+        self._signatures.clear()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def signature(self, text: str) -> tuple[int, ...] | None:
+        """
+        Compute the MinHash signature of the text, or None if it has no words.
+        """
+        shingles = shingle_text(text, self.shingle_size)
+        if not shingles:
+            return None
+        shingle_hashes = [
+            int.from_bytes(
+                hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "big"
+            )
+            for shingle in shingles
+        ]
+        return tuple(
+            min(
+                ((a * shingle_hash + b) % MERSENNE_PRIME) & MAX_HASH
+                for shingle_hash in shingle_hashes
+            )
+            for a, b in self._permutations
+        )
+
+    def _bands(self, signature: tuple[int, ...]):
+        for band in range(self.bands):
+            start = band * self.rows_per_band
+            yield band, signature[start : start + self.rows_per_band]
+
+    @staticmethod
+    def estimate_similarity(signature: tuple, other_signature: tuple) -> float:
+        matches = sum(a == b for a, b in zip(signature, other_signature))
+        return matches / len(signature)
+
+    def add(self, key: str, text: str) -> bool:
+        """
+        Index the text under key. Returns False if the text has no words.
+        """
+        signature = self.signature(text)
+        if signature is None or key in self._signatures:
+            return signature is not None
+        self._signatures[key] = signature
+        for band, band_values in self._bands(signature):
+            self._buckets[band][band_values].append(key)
+        return True
+
+    def find_duplicate(self, text: str) -> str | None:
+        """
+        Return the key of the most similar indexed text at or above the threshold.
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return None
+
+        candidates = set()
+        for band, band_values in self._bands(signature):
+            candidates.update(self._buckets[band].get(band_values, ()))
+
+        best_key, best_similarity = None, self.threshold
+        for candidate in candidates:
+            similarity = self.estimate_similarity(
+                signature, self._signatures[candidate]
+            )
+            if similarity >= best_similarity:
+                best_key, best_similarity = candidate, similarity
+        return best_key
@@ -0,0 +1,14 @@
+import sqlite3
+from contextlib import closing, contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def connect_sqlite(database_path: str) -> Iterator[sqlite3.Connection]:
+    """
+    Open a connection to a SQLite database, committing on success (rolling back on
+    error) and always closing it, which "with sqlite3.connect(...)" alone doesn't do.
+    """
+    with closing(sqlite3.connect(database_path)) as connection:
+        with connection:
+            yield connection
@@ -0,0 +1,55 @@
+import unittest
+from llm_input import (
+    build_llm_input,
+    chunk_text,
+    count_tokens,
+    split_into_passages,
+)
+
+
+class TestSplitIntoPassages(unittest.TestCase):
+    def test_split_paragraphs(self):
+        self.assertEqual(
+            split_into_passages("First paragraph.\n\nSecond one.\nThird one."),
+            ["First paragraph.", "Second one.", "Third one."],
+        )
+
+    def test_split_sentences_without_line_breaks(self):
+        self.assertEqual(
+            split_into_passages("One sentence. Another one! A question?"),
+            ["One sentence.", "Another one!", "A question?"],
+        )
+
+    def test_empty_text(self):
+        self.assertEqual(split_into_passages(""), [])
+
+
+class TestBuildLLMInput(unittest.TestCase):
+    def test_text_within_budget_is_unchanged(self):
+        text = "A short article about housing."
+        self.assertEqual(build_llm_input(text, 100), text)
+
+    def test_keeps_lead_passages_within_budget(self):
+        text = " ".join(f"Sentence number {i} of the article." for i in range(200))
+        trimmed_text = build_llm_input(text, 50)
+        self.assertTrue(trimmed_text.startswith("Sentence number 0 of the article."))
+        self.assertLessEqual(count_tokens(trimmed_text), 50)
+        self.assertTrue(trimmed_text.endswith("."))
+
+    def test_truncates_overlong_lead_passage(self):
+        text = "word " * 1000
+        self.assertLessEqual(count_tokens(build_llm_input(text, 20)), 20)
+
+
+class TestChunkText(unittest.TestCase):
+    def test_chunks_cover_text_within_size(self):
+        text = " ".join(f"Sentence number {i} of the article." for i in range(200))
+        chunks = chunk_text(text, 100)
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(count_tokens(chunk), 100)
+        self.assertEqual(" ".join(chunks), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
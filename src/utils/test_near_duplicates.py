@@ -0,0 +1,68 @@
+import unittest
+from near_duplicates import NearDuplicateIndex, shingle_text
+
+
+class TestShingleText(unittest.TestCase):
+    def test_word_pairs_ignore_case_and_punctuation(self):
+        self.assertEqual(
+            shingle_text("Middle housing, in Canada!"),
+            {"middle housing", "housing in", "in canada"},
+        )
+
+    def test_short_text(self):
+        self.assertEqual(shingle_text("Housing"), {"housing"})
+        self.assertEqual(shingle_text(""), set())
+
+
+class TestNearDuplicateIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = NearDuplicateIndex(threshold=0.6)
+        self.index.add(
+            "https://example.com/a",
+            "Ontario announces new funding to build missing middle housing in Toronto",
+        )
+
+    def test_clear(self):
+        self.index.clear()
+        self.assertEqual(len(self.index), 0)
+        self.assertIsNone(
+            self.index.find_duplicate(
+                "Ontario announces new funding to build missing middle housing in Toronto"
+            )
+        )
+
+    def test_empty_like_has_comparable_signatures(self):
+        text = "Ontario announces new funding to build missing middle housing"
+        self.assertEqual(
+            self.index.empty_like().signature(text), self.index.signature(text)
+        )
+
+    def test_find_same_story(self):
+        self.assertEqual(
+            self.index.find_duplicate(
+                "Ontario announces new funding to build missing middle housing in Toronto."
+            ),
+            "https://example.com/a",
+        )
+
+    def test_find_near_duplicate(self):
+        self.assertEqual(
+            self.index.find_duplicate(
+                "Ontario announces new funding to build missing middle housing in Ottawa"
+            ),
+            "https://example.com/a",
+        )
+
+    def test_ignore_different_story(self):
+        self.assertIsNone(
+            self.index.find_duplicate("Vancouver rents fall for the third month in a row")
+        )
+
+    def test_ignore_empty_text(self):
+        self.assertFalse(self.index.add("https://example.com/b", ""))
+        self.assertIsNone(self.index.find_duplicate(""))
+        self.assertEqual(len(self.index), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,12 @@
 import unittest
-from text_processing import normalize_html_content
+from text_processing import (
+    normalize_html_content,
+    normalize_url,
+    filter_text_for_llm,
+    remove_websites_and_social_media_mentions,
+    TextCleaningEngine,
+    TextCleaningRule,
+)
 
 
 class TestNormalizeHTMLContent(unittest.TestCase):
@@ -29,5 +36,92 @@ class TestNormalizeHTMLContent(unittest.TestCase):
         )
 
 
+class TestFilterTextForLLM(unittest.TestCase):
+    def test_remove_social_media_mentions(self):
+        self.assertEqual(
+            remove_websites_and_social_media_mentions(
+                "Follow us Twitter: https://twitter.com/x  and LinkedIn:"
+            ),
+            "Follow us and",
+        )
+
+    def test_social_media_mentions_are_case_sensitive(self):
+        self.assertEqual(
+            remove_websites_and_social_media_mentions("twitter: news"),
+            "twitter: news",
+        )
+
+    def test_remove_boilerplate_phrases(self):
+        self.assertEqual(
+            filter_text_for_llm(
+                "Housing starts rose. Please keep comments relevant and respectful. "
+                "CLICK HERE TO READ MORE. Prices fell. Read more"
+            ),
+            "Housing starts rose. Prices fell.",
+        )
+
+    def test_remove_boilerplate_across_line_breaks(self):
+        self.assertEqual(
+            filter_text_for_llm(
+                "This website uses cookies to\ntrack you. By continuing to use our site, "
+                "you agree to our Terms of Use and Privacy Policy. Body.\n"
+                "For more information\n click here. End"
+            ),
+            "Body. End",
+        )
+
+    def test_remove_written_by_label(self):
+        self.assertEqual(
+            filter_text_for_llm("Written by Jane Doe on Monday"), "Jane Doe on Monday"
+        )
+
+
+class TestTextCleaningEngine(unittest.TestCase):
+    def test_register_rule(self):
+        engine = TextCleaningEngine([TextCleaningRule("ads", r"Advertisement")])
+        engine.register_rule(TextCleaningRule("sponsored", r"Sponsored content"))
+        self.assertEqual(
+            engine.clean("Advertisement News  SPONSORED CONTENT here"), "News here"
+        )
+
+    def test_rule_with_alternation(self):
+        engine = TextCleaningEngine([TextCleaningRule("ads", r"Advertisement|Sponsored")])
+        self.assertEqual(engine.clean("Advertisement News Sponsored here"), "News here")
+
+    def test_rule_with_optional_first_char(self):
+        engine = TextCleaningEngine([TextCleaningRule("ads", r"a?bc")])
+        self.assertEqual(engine.clean("x bc y abc z"), "x y z")
+
+    def test_duplicate_rule_name(self):
+        engine = TextCleaningEngine([TextCleaningRule("ads", r"Advertisement")])
+        with self.assertRaises(ValueError):
+            engine.register_rule(TextCleaningRule("ads", r"Ad"))
+
+    def test_version_changes_with_rules(self):
+        engine = TextCleaningEngine([TextCleaningRule("ads", r"Advertisement")])
+        version = engine.version
+        engine.register_rule(TextCleaningRule("sponsored", r"Sponsored content"))
+        self.assertNotEqual(engine.version, version)
+
+
+class TestNormalizeURL(unittest.TestCase):
+    def test_drop_tracking_params(self):
+        self.assertEqual(
+            normalize_url(
+                "https://news.google.com/rss/articles/CBMiABC?oc=5&utm_source=feed"
+            ),
+            "https://news.google.com/rss/articles/CBMiABC",
+        )
+
+    def test_keep_other_params_sorted(self):
+        self.assertEqual(
+            normalize_url("HTTPS://Example.com/story/?b=2&a=1#comments"),
+            "https://example.com/story?a=1&b=2",
+        )
+
+    def test_empty_url(self):
+        self.assertIsNone(normalize_url(None))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,92 +1,221 @@
+import hashlib
 import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from bs4 import BeautifulSoup
 
+# Bump when the default rules below change, so cached results derived from cleaned
+# text (e.g. LLM results) are invalidated
+TEXT_CLEANING_RULES_VERSION = 1
 
-def remove_websites_and_social_media_mentions(text):
-    # List of common social media & general website labels
-    platform_keywords = [
-        "Website",
-        "Facebook",
-        "LinkedIn",
-        "Twitter",
-        "YouTube",
-        "Instagram",
-        "TikTok",
-        "Github",
-        "Medium",
-        "Reddit",
-    ]
+# List of common social media & general website labels
+PLATFORM_KEYWORDS = [
+    "Website",
+    "Facebook",
+    "LinkedIn",
+    "Twitter",
+    "YouTube",
+    "Instagram",
+    "TikTok",
+    "Github",
+    "Medium",
+    "Reddit",
+]
 
-    # Regex pattern to match: "Platform: URL" OR "Platform:" (with no URL)
-    platform_pattern = rf'\b(?:{"|".join(platform_keywords)})\s*:\s*(https?://\S+)?'
+# Common texts that are not relevant for LLM/AI generation
+BOILERPLATE_PHRASES = [
+    r"You can save this article by registering for freehere\.",
+    r"Reviews and recommendations are unbiased and products are independently selected\.",
+    r"Postmedia may earn an affiliate commission from purchases made through links on this page\.",
+    r"Postmedia is committed to maintaining a lively but civil forum for discussion.",
+    r"Written by.*?(?=\s)",  # removes 'Written by' and subsequent content until a space
+    r"Last modified:.*?(?=\s)",
+    r"Please keep comments relevant and respectful\.",
+    r"This website uses cookies.*?(?=By continuing)",  # example pattern
+    r"Having trouble logging in\?",
+    r"Click here for more information\.",
+    r"Click here to unsubscribe\.",
+    r"Click here to view in browser\.",
+    r"Click here to read more\.",
+    r"Read more(?=\s*$)",
+    r"Comments may take up to an hour to appear on the site\.",
+    r"You will receive an email if there is a reply to your comment, an update to a thread you follow or if a user you follow comments\.",
+    r"For more information *?click here\.",
+    r"By continuing to use our site, you agree to our Terms of Use and Privacy Policy.",
+    r"Visit our Community Guidelines",
+    # Add more patterns as needed
+]
 
-    # General URL pattern (removes all links)
-    url_pattern = r"https?://\S+"
+WHITESPACE_PATTERN = re.compile(r"\s+")
+HTML_TAG_OR_URL_PATTERN = re.compile(r"<[^>]+>|http\S+")
+# A literal first character that is required (not followed by ?, * or {m,n})
+LITERAL_START_PATTERN = re.compile(r"(?:\\b)?([A-Za-z0-9])(?![?*{])")
 
-    # Remove social media mentions
-    text = re.sub(platform_pattern, "", text)
 
-    # Remove any remaining URLs
-    text = re.sub(url_pattern, "", text)
+class TextCleaningRule:
+    """
+    A regex pattern whose matches are removed from text.
+    leading_chars lists the characters a match can start with; it is derived from
+    patterns without alternation that start with a required literal character.
+    """
 
-    # Clean up extra spaces
-    text = re.sub(r"\s+", " ", text).strip()
+    def __init__(
+        self,
+        name: str,
+        pattern: str,
+        ignore_case: bool = True,
+        leading_chars: str = None,
+    ):
+        self.name = name
+        self.pattern = pattern
+        self.ignore_case = ignore_case
+        self._leading_chars = leading_chars
 
-    return text
+    def to_regex(self) -> str:
+        # Scoped flags keep case sensitivity per rule inside the combined pattern
+        return f"(?i:{self.pattern})" if self.ignore_case else f"(?:{self.pattern})"
 
+    def get_leading_chars(self) -> set[str] | None:
+        """
+        Characters a match can start with, or None if unknown.
+        """
+        leading_chars = self._leading_chars
+        if leading_chars is None:
+            # A top-level "|" lets a match start elsewhere, so alternations are skipped
+            if "|" in self.pattern:
+                return None
+            literal_start = LITERAL_START_PATTERN.match(self.pattern)
+            if not literal_start:
+                return None
+            leading_chars = literal_start.group(1)
 
-def filter_text_for_llm(text):
-    """Filter text to remove unneeded content for LLM/AI generation."""
-    # Remove social media mentions and URLs
-    text = remove_websites_and_social_media_mentions(text)
-
-    # Remove common texts that are not relevant
-    phrases_to_remove = [
-        r"You can save this article by registering for freehere\.",
-        r"Reviews and recommendations are unbiased and products are independently selected\.",
-        r"Postmedia may earn an affiliate commission from purchases made through links on this page\.",
-        r"Postmedia is committed to maintaining a lively but civil forum for discussion.",
-        r"Written by.*?(?=\s)",  # removes 'Written by' and subsequent content until a space
-        r"Last modified:.*?(?=\s)",
-        r"Please keep comments relevant and respectful\.",
-        r"This website uses cookies.*?(?=By continuing)",  # example pattern
-        r"Having trouble logging in\?",
-        r"Click here for more information\.",
-        r"Click here to unsubscribe\.",
-        r"Click here to view in browser\.",
-        r"Click here to read more\.",
-        r"Read more$",
-        r"Comments may take up to an hour to appear on the site\.",
-        r"You will receive an email if there is a reply to your comment, an update to a thread you follow or if a user you follow comments\.",
-        r"For more information *?click here\.",
-        r"By continuing to use our site, you agree to our Terms of Use and Privacy Policy.",
-        r"Visit our Community Guidelines",
-        # Add more patterns as needed
+        if self.ignore_case:
+            leading_chars = leading_chars.lower() + leading_chars.upper()
+        return set(leading_chars)
+
+
+class TextCleaningEngine:
+    """
+    Registry of text cleaning rules, compiled once into a single combined pattern,
+    so each engine cleans text in one substitution pass between two whitespace passes.
+    """
+
+    def __init__(
+        self,
+        rules: list[TextCleaningRule] = None,
+        base_version: int = TEXT_CLEANING_RULES_VERSION,
+    ):
+        self.rules: list[TextCleaningRule] = []
+        self.base_version = base_version
+        self._compiled_pattern: re.Pattern | None = None
+        for rule in rules or []:
+            self.register_rule(rule)
+
+    def register_rule(self, rule: TextCleaningRule):
+        """
+        Add a rule. Rules are tried in registration order at each position in the text.
+        """
+        if any(existing_rule.name == rule.name for existing_rule in self.rules):
+            raise ValueError(f"A text cleaning rule named {rule.name} already exists")
+        self.rules.append(rule)
+        self._compiled_pattern = None
+
+    @property
+    def version(self) -> str:
+        """
+        Version of the rule set, changing whenever rules are added or edited.
+        """
+        rules_digest = hashlib.sha1(
+            "\n".join(rule.to_regex() for rule in self.rules).encode("utf-8")
+        ).hexdigest()
+        return f"{self.base_version}-{rules_digest[:8]}"
+
+    @property
+    def compiled_pattern(self) -> re.Pattern:
+        if self._compiled_pattern is None:
+            combined_pattern = "|".join(rule.to_regex() for rule in self.rules)
+
+            # Skip positions no rule can match at, before trying every alternative
+            leading_chars = set()
+            for rule in self.rules:
+                rule_leading_chars = rule.get_leading_chars()
+                if rule_leading_chars is None:
+                    leading_chars = None
+                    break
+                leading_chars |= rule_leading_chars
+            if leading_chars:
+                leading_chars_class = "".join(
+                    re.escape(char) for char in sorted(leading_chars)
+                )
+                combined_pattern = f"(?=[{leading_chars_class}])(?:{combined_pattern})"
+
+            self._compiled_pattern = re.compile(combined_pattern)
+        return self._compiled_pattern
+
+    def clean(self, text: str) -> str:
+        # Rules are written against single-spaced text (e.g. " *?" and ".*?" spanning
+        # what were line breaks), so whitespace is collapsed before and after
+        text = WHITESPACE_PATTERN.sub(" ", text).strip()
+        if self.rules:
+            text = self.compiled_pattern.sub("", text)
+            text = WHITESPACE_PATTERN.sub(" ", text).strip()
+        return text
+
+
+def _create_website_rules() -> list[TextCleaningRule]:
+    return [
+        # "Platform: URL" OR "Platform:" (with no URL)
+        TextCleaningRule(
+            "platform_mentions",
+            rf'\b(?:{"|".join(PLATFORM_KEYWORDS)})\s*:\s*(?:https?://\S+)?',
+            ignore_case=False,
+            leading_chars="".join(keyword[0] for keyword in PLATFORM_KEYWORDS),
+        ),
+        # General URL pattern (removes all links)
+        TextCleaningRule("urls", r"https?://\S+", ignore_case=False),
     ]
 
-    # Remove each unwanted phrase/pattern from the text
-    for pattern in phrases_to_remove:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
 
-    # Final cleanup: remove any extra spaces that may have resulted
-    text = re.sub(r"\s+", " ", text).strip()
+def _create_boilerplate_rules() -> list[TextCleaningRule]:
+    return [
+        TextCleaningRule(f"boilerplate_{index}", pattern)
+        for index, pattern in enumerate(BOILERPLATE_PHRASES)
+    ]
 
-    return text
+
+# Engine for social media mentions and URLs only
+website_cleaning_engine = TextCleaningEngine(_create_website_rules())
+
+# Engine for boilerplate phrases in LLM input, run after website_cleaning_engine
+# (so e.g. "Read more$" matches once a trailing URL is removed). Extend with
+# text_cleaning_engine.register_rule(...)
+text_cleaning_engine = TextCleaningEngine(_create_boilerplate_rules())
+
+
+def get_text_cleaning_version() -> str:
+    """
+    Version of the rules filter_text_for_llm applies, to key text cleaned with them.
+    """
+    return f"{website_cleaning_engine.version}.{text_cleaning_engine.version}"
+
+
+def remove_websites_and_social_media_mentions(text):
+    """Remove social media mentions and URLs, and clean up extra spaces."""
+    return website_cleaning_engine.clean(text)
+
+
+def filter_text_for_llm(text):
+    """Filter text to remove unneeded content for LLM/AI generation."""
+    return text_cleaning_engine.clean(website_cleaning_engine.clean(text))
 
 
 def clean_and_normalize_text(text):
     """Clean and normalize text for human-readable display."""
-    text = re.sub(r"<[^>]+>", "", text)  # Remove HTML tags
-    text = re.sub(r"http\S+", "", text)  # Remove URLs
-    text = re.sub(r"\s+", " ", text).strip()  # Normalize whitespace
+    text = HTML_TAG_OR_URL_PATTERN.sub("", text)  # Remove HTML tags and URLs
 
     # Replace non-breaking spaces (&nbsp;) with regular spaces
     text = text.replace("&nbsp;", " ")
 
-    # # Normalize whitespace and fix encoding
-    # text = " ".join(text.split()).strip()
-
-    return text
+    return WHITESPACE_PATTERN.sub(" ", text).strip()  # Normalize whitespace
 
 
 def normalize_html_content(raw_html):
@@ -102,6 +231,35 @@ def normalize_html_content(raw_html):
     return text
 
 
+# Query parameters that only track where a link was shared or clicked from
+TRACKING_QUERY_PARAMS = {"oc", "fbclid", "gclid", "mc_cid", "mc_eid", "ref"}
+
+
+def normalize_url(url):
+    """
+    Normalize a URL for comparing links: lowercase the scheme and host, and drop
+    the fragment, tracking query parameters (utm_*, oc, ...) and trailing slash.
+    """
+    if not url:
+        return url
+    parts = urlsplit(url.strip())
+    query_params = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+        and key.lower() not in TRACKING_QUERY_PARAMS
+    )
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/") or "/",
+            urlencode(query_params),
+            "",
+        )
+    )
+
+
 from googlenewsdecoder import gnewsdecoder
 
 